@@ -1,25 +1,50 @@
 import difflib
 import json
+import logging
 import os
+import re
+import sys
+from functools import lru_cache
 
 import tidalapi
 
+try:
+    import orjson
+except ImportError:  # pip install orjson for faster loading
+    orjson = None
+
+_BRACKETS = re.compile(r"\(.*?\)|\[.*?\]")
+_PUNCT = re.compile(r"[^a-z0-9 ]")
+_WS = re.compile(r"\s+")
+_PARENS = re.compile(r"\(.*?\)")
+
+# Per-candidate details are only shown with -v
+logging.basicConfig(
+    level=logging.DEBUG if "-v" in sys.argv[1:] else logging.INFO,
+    format="%(message)s",
+)
+log = logging.getLogger(__name__)
+
 
+@lru_cache(maxsize=65536)
 def normalize_string(s):
     if not s:
         return ""
-    import re
+    s = _BRACKETS.sub("", s.lower())  # remove brackets
+    s = _PUNCT.sub("", s)  # remove punctuation
+    return _WS.sub(" ", s).strip()  # collapse spaces
 
-    s = s.lower()
-    s = re.sub(r"\(.*?\)|\[.*?\]", "", s)  # remove brackets
-    s = re.sub(r"[^a-z0-9 ]", "", s)  # remove punctuation
-    s = re.sub(r"\s+", " ", s).strip()  # collapse spaces
-    return s
+
+def load_json(path):
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r") as f:
+        return json.load(f)
 
 
 # Load discogs_tracks.json
-with open("discogs_tracks.json", "r") as f:
-    discogs_tracks = json.load(f)
+discogs_tracks = load_json("discogs_tracks.json")
 
 # Find the next example track
 example = None
@@ -44,8 +69,7 @@ print(f"Example track: {example.get('title')} by {artist}")
 # Prepare Tidal session
 TOKEN_PATH = os.path.expanduser("~/Documents/tidal_session.json")
 session = tidalapi.Session()
-with open(TOKEN_PATH, "r") as f:
-    creds = json.load(f)
+creds = load_json(TOKEN_PATH)
 session.load_oauth_session(
     creds["token_type"], creds["access_token"], creds["refresh_token"]
 )
@@ -59,9 +83,7 @@ search_queries = [
     f"{example.get('title')} {artist}",
     f"{normalize_string(example.get('title'))} {normalize_string(artist)}",
 ]
-import re
-
-base_title = re.sub(r"\(.*?\)", "", example.get("title")).strip()
+base_title = _PARENS.sub("", example.get("title")).strip()
 if base_title != example.get("title"):
     search_queries.append(f"{base_title} {artist}")
 search_queries.append(base_title)
@@ -77,14 +99,21 @@ for search_query in search_queries:
     norm_artist = normalize_string(artist)
     best = None
     best_score = 0
+    # difflib indexes seq2, so keep the targets there and swap candidates in
+    title_matcher = difflib.SequenceMatcher(None, "", norm_title)
+    artist_matcher = difflib.SequenceMatcher(None, "", norm_artist)
     for tidal_track in tracks:
-        t_title = normalize_string(tidal_track.name)
-        t_artist = normalize_string(tidal_track.artist.name)
-        title_ratio = difflib.SequenceMatcher(None, t_title, norm_title).ratio()
-        artist_ratio = difflib.SequenceMatcher(None, t_artist, norm_artist).ratio()
+        title_matcher.set_seq1(normalize_string(tidal_track.name))
+        artist_matcher.set_seq1(normalize_string(tidal_track.artist.name))
+        title_ratio = title_matcher.ratio()
+        artist_ratio = artist_matcher.ratio()
         score = title_ratio + artist_ratio
-        print(
-            f"  Tidal: {tidal_track.name} by {tidal_track.artist.name} (id={tidal_track.id}, score={score:.2f})"
+        log.debug(
+            "  Tidal: %s by %s (id=%s, score=%.2f)",
+            tidal_track.name,
+            tidal_track.artist.name,
+            tidal_track.id,
+            score,
         )
         if score > best_score:
             best = tidal_track
@@ -1,24 +1,86 @@
+import asyncio
 import difflib
 import json
+import logging
 import os
 import re
+import shelve
+import sys
+import time
+from collections import defaultdict
+from functools import lru_cache
+from types import SimpleNamespace
 
 import tidalapi
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # pip install rapidfuzz for much faster matching
+    fuzz = process = None
 
+try:
+    import orjson
+except ImportError:  # pip install orjson for faster loading
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pip install ijson to stream large track files
+    ijson = None
+
+_BRACKETS = re.compile(r"\(.*?\)|\[.*?\]")
+_PUNCT = re.compile(r"[^a-z0-9 ]")
+_WS = re.compile(r"\s+")
+_PARENS = re.compile(r"\(.*?\)")
+
+# Per-candidate details are only shown with -v
+logging.basicConfig(
+    level=logging.DEBUG if "-v" in sys.argv[1:] else logging.INFO,
+    format="%(message)s",
+)
+log = logging.getLogger(__name__)
+
+
+# The same Tidal titles and artists come back for every query attempt
+@lru_cache(maxsize=100_000)
 def normalize_string(s):
     if not s:
         return ""
     s = s.lower()
-    s = re.sub(r"\(.*?\)|\[.*?\]", "", s)  # remove brackets
-    s = re.sub(r"[^a-z0-9 ]", "", s)  # remove punctuation
-    s = re.sub(r"\s+", " ", s).strip()  # collapse spaces
+    s = _BRACKETS.sub("", s)  # remove brackets
+    s = _PUNCT.sub("", s)  # remove punctuation
+    s = _WS.sub(" ", s).strip()  # collapse spaces
     return s
 
 
-def filter_release_tracks(discogs_tracks, release_id):
-    """Return all tracks for a given release id."""
-    return [t for t in discogs_tracks if t.get("release", {}).get("id") == release_id]
+def load_json(path):
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def index_by_release(discogs_tracks):
+    """Group tracks by release id, so each release is a single lookup."""
+    index = defaultdict(list)
+    for t in discogs_tracks:
+        index[t.get("release", {}).get("id")].append(t)
+    return index
+
+
+def load_release_tracks(path, release_id):
+    """Tracks of one release, streamed so only the matches are kept in memory."""
+    if ijson is None:
+        return index_by_release(load_json(path)).get(release_id, [])
+    with open(path, "rb") as f:
+        return [
+            t
+            for t in ijson.items(f, "item")
+            if t.get("release", {}).get("id") == release_id
+        ]
 
 
 def flatten_release_tracklist(release_tracks):
@@ -57,8 +119,7 @@ def print_flat_tracks(flat_tracks, release_id):
 
 def tidal_login(token_path):
     session = tidalapi.Session()
-    with open(token_path, "r") as f:
-        creds = json.load(f)
+    creds = load_json(token_path)
     session.load_oauth_session(
         creds["token_type"], creds["access_token"], creds["refresh_token"]
     )
@@ -66,58 +127,211 @@ def tidal_login(token_path):
         print("Tidal login failed!")
         exit(1)
     print("Tidal login successful!")
+    configure_pool(session)
     return session
 
 
+def configure_pool(session, pool_size=16):
+    """Keep connections alive for concurrent searches and retry throttled calls."""
+    http = getattr(session, "request_session", None)
+    if http is None:  # Older tidalapi without a shared requests.Session
+        return
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,  # Let tidalapi see the final response
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+    http.mount("https://", adapter)
+    http.mount("http://", adapter)
+
+
 def build_search_queries(title, artist):
     queries = [
         f"{title} {artist}",
         f"{normalize_string(title)} {normalize_string(artist)}",
     ]
-    base_title = re.sub(r"\(.*?\)", "", title).strip()
+    base_title = _PARENS.sub("", title).strip()
     if base_title != title:
         queries.append(f"{base_title} {artist}")
     queries.append(base_title)
     queries.append(artist)
-    return queries
+    # Each duplicate would be another round-trip to the rate-limited API.
+    # Tidal search ignores case and spacing, so the normalized variant of a
+    # plain ASCII title is the same search as the first query.
+    seen = set()
+    unique = []
+    for q in queries:
+        key = " ".join(q.lower().split())
+        if key and key not in seen and normalize_string(q):
+            seen.add(key)
+            unique.append(q.strip())
+    return unique
+
+
+class Matcher:
+    """Scores candidates against one target; 0.0 if they can't beat cutoff."""
+
+    def __init__(self, target, cutoff=0.0):
+        self.target = target
+        self.cutoff = cutoff
+        # difflib caches its lookup table for seq2, so keep the target there
+        self._sm = difflib.SequenceMatcher(None, "", target)
+
+    def __call__(self, candidate):
+        return self.score_all([candidate])[0]
+
+    def score_all(self, candidates):
+        """Scores for each candidate, fuzzy-scoring the rest in one batch."""
+        scores = [self._quick_score(c) for c in candidates]
+        pending = [i for i, score in enumerate(scores) if score is None]
+        if not pending:
+            return scores
+        if fuzz is not None:
+            cutoff = self.cutoff * 100
+            try:
+                # One native call for all candidates (needs numpy)
+                batch = process.cdist(
+                    [self.target],
+                    [candidates[i] for i in pending],
+                    scorer=fuzz.ratio,
+                    score_cutoff=cutoff,
+                    workers=-1,
+                )[0]
+            except ImportError:
+                batch = [
+                    fuzz.ratio(candidates[i], self.target, score_cutoff=cutoff)
+                    for i in pending
+                ]
+            for i, score in zip(pending, batch):
+                scores[i] = float(score) / 100
+            return scores
+        for i in pending:
+            self._sm.set_seq1(candidates[i])
+            # Character-bag upper bound before the O(n*m) ratio()
+            if self._sm.quick_ratio() <= self.cutoff:
+                scores[i] = 0.0
+            else:
+                scores[i] = self._sm.ratio()
+        return scores
+
+    def _quick_score(self, candidate):
+        """Score settled without fuzzy matching, or None."""
+        if candidate == self.target:
+            return 1.0
+        if candidate and self.target and (
+            candidate in self.target or self.target in candidate
+        ):
+            return 0.95
+        # Matches can't exceed the shorter length, so 2 * min / total bounds
+        # the ratio; most unrelated artists fail this integer check
+        shorter = min(len(candidate), len(self.target))
+        if 2 * shorter <= self.cutoff * (len(candidate) + len(self.target)):
+            return 0.0
+        return None
 
 
 def get_artist_matches(tidal_tracks, norm_artist):
-    artist_matches = []
-    for tidal_track in tidal_tracks:
-        t_artist = normalize_string(tidal_track.artist.name)
-        artist_ratio = difflib.SequenceMatcher(None, t_artist, norm_artist).ratio()
-        if artist_ratio > 0.85:
-            artist_matches.append((tidal_track, artist_ratio))
-    return artist_matches
+    t_artists = [normalize_string(t.artist.name) for t in tidal_tracks]
+    artist_ratios = Matcher(norm_artist, cutoff=0.85).score_all(t_artists)
+    return [
+        (tidal_track, artist_ratio)
+        for tidal_track, artist_ratio in zip(tidal_tracks, artist_ratios)
+        if artist_ratio > 0.85
+    ]
 
 
 def get_best_track_match(artist_matches, norm_title):
     best = None
     best_score = 0
-    for tidal_track, artist_ratio in artist_matches:
-        t_title = normalize_string(tidal_track.name)
-        title_ratio = difflib.SequenceMatcher(None, t_title, norm_title).ratio()
+    t_titles = [normalize_string(t.name) for t, _ in artist_matches]
+    title_ratios = Matcher(norm_title, cutoff=0.7).score_all(t_titles)
+    for (tidal_track, artist_ratio), title_ratio in zip(artist_matches, title_ratios):
         score = artist_ratio + title_ratio
-        print(
-            f"    Tidal: {tidal_track.name} by {tidal_track.artist.name} "
-            f"(id={tidal_track.id}, artist_score={artist_ratio:.2f}, "
-            f"title_score={title_ratio:.2f})"
+        log.debug(
+            "    Tidal: %s by %s (id=%s, artist_score=%.2f, title_score=%.2f)",
+            tidal_track.name,
+            tidal_track.artist.name,
+            tidal_track.id,
+            artist_ratio,
+            title_ratio,
         )
         if title_ratio > 0.7 and score > best_score:
             best = tidal_track
             best_score = score
+            if best_score >= 1.9:  # Exact or substring hit on both fields
+                break
     return best, best_score
 
 
-def find_best_tidal_match(session, title, artist):
+class AsyncRateLimiter:
+    """Spaces out calls so that at most `per_second` start each second."""
+
+    def __init__(self, per_second):
+        self._interval = 1 / per_second
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class TidalSearcher:
+    """Cached session.search() that runs in worker threads, throttled."""
+
+    def __init__(self, session, cache, max_concurrent=8, per_second=10):
+        self.session = session
+        self.cache = cache  # Only touched from the event loop thread
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._limiter = AsyncRateLimiter(per_second)
+
+    async def search(self, query):
+        """Tidal tracks for query, remembered on disk for SEARCH_CACHE_TTL."""
+        entry = self.cache.get(query)
+        if entry and time.time() - entry[0] < SEARCH_CACHE_TTL:
+            rows = entry[1]
+        else:
+            result = await self._search_with_retry(query)
+            # Only keep what the scoring code reads to keep the cache small
+            rows = [
+                (t.id, t.name, t.artist.name if t.artist else "")
+                for t in result.get("tracks", [])
+            ]
+            self.cache[query] = (time.time(), rows)
+        return [
+            SimpleNamespace(id=id_, name=name, artist=SimpleNamespace(name=artist))
+            for id_, name, artist in rows
+        ]
+
+    async def _search_with_retry(self, query, attempts=5):
+        async with self._semaphore:
+            for attempt in range(attempts):
+                await self._limiter.wait()
+                try:
+                    return await asyncio.to_thread(self.session.search, query)
+                except Exception as e:
+                    # tidalapi surfaces rate limiting as a requests HTTPError
+                    status = getattr(getattr(e, "response", None), "status_code", None)
+                    if status != 429 or attempt == attempts - 1:
+                        raise
+                    await asyncio.sleep(2**attempt)
+
+
+async def find_best_tidal_match(searcher, title, artist):
     queries = build_search_queries(title, artist)
     norm_title = normalize_string(title)
     norm_artist = normalize_string(artist)
     for search_query in queries:
         print(f"  Searching Tidal for: {search_query}")
-        result = session.search(search_query)
-        tidal_tracks = result.get("tracks", [])
+        tidal_tracks = await searcher.search(search_query)
         artist_matches = get_artist_matches(tidal_tracks, norm_artist)
         if not artist_matches:
             print("    No strong artist match found. Aborting search for this query.")
@@ -133,22 +347,34 @@ def find_best_tidal_match(session, title, artist):
     return None
 
 
-def search_and_match_tracks(session, tracks):
-    for track in tracks:
+async def search_and_match_tracks(session, tracks, cache):
+    # Created here so its asyncio primitives belong to the running loop
+    searcher = TidalSearcher(session, cache)
+    # One search per (title, artist), shared by repeated tracks
+    matches = {}
+
+    async def match(track):
         title = track.get("title")
         artist = track.get("artist")
-        print(f"\nSearching for: {title} by {artist}")
-        find_best_tidal_match(session, title, artist)
+        key = (title, artist)
+        if key not in matches:
+            print(f"\nSearching for: {title} by {artist}")
+            matches[key] = asyncio.ensure_future(
+                find_best_tidal_match(searcher, title, artist)
+            )
+        return await matches[key]
+
+    # Tracks are searched concurrently; output lines may interleave
+    return await asyncio.gather(*(match(track) for track in tracks))
 
 
 # --- MAIN EXECUTION ---
 RELEASE_ID = 30019903
 TOKEN_PATH = os.path.expanduser("~/Documents/tidal_session.json")
+SEARCH_CACHE_PATH = os.path.expanduser("~/.cache/discogs_to_tidal/spike_search")
+SEARCH_CACHE_TTL = 30 * 24 * 3600  # 30 days
 
-with open("discogs_tracks.json", "r") as f:
-    discogs_tracks = json.load(f)
-
-release_tracks = filter_release_tracks(discogs_tracks, RELEASE_ID)
+release_tracks = load_release_tracks("discogs_tracks.json", RELEASE_ID)
 print(f"Found {len(release_tracks)} tracks for release {RELEASE_ID}")
 for t in release_tracks:
     print(f"  {t.get('title')} by {t.get('artist')}")
@@ -157,4 +383,6 @@ flat_tracks = flatten_release_tracklist(release_tracks)
 print_flat_tracks(flat_tracks, RELEASE_ID)
 
 session = tidal_login(TOKEN_PATH)
-search_and_match_tracks(session, flat_tracks)
+os.makedirs(os.path.dirname(SEARCH_CACHE_PATH), exist_ok=True)
+with shelve.open(SEARCH_CACHE_PATH) as search_cache:
+    asyncio.run(search_and_match_tracks(session, flat_tracks, search_cache))
@@ -1,18 +1,20 @@
+import json
 import os
-import time
 
 import tidalapi
 
+try:
+    import orjson
+except ImportError:  # pip install orjson for faster loading
+    orjson = None
+
 # Use your existing token file
 TOKEN_PATH = os.path.expanduser("~/Documents/tidal_session.json")
 
 # Load session from token file
 session = tidalapi.Session()
-with open(TOKEN_PATH, "r") as f:
-    data = f.read()
-import json
-
-creds = json.loads(data)
+with open(TOKEN_PATH, "rb") as f:
+    creds = orjson.loads(f.read()) if orjson is not None else json.load(f)
 session.load_oauth_session(
     creds["token_type"], creds["access_token"], creds["refresh_token"]
 )
@@ -23,11 +25,7 @@ print("Tidal login successful!")
 
 # Find playlist named "House"
 playlists = session.user.playlists()
-playlist = None
-for pl in playlists:
-    if hasattr(pl, "name") and pl.name == "House":
-        playlist = pl
-        break
+playlist = next((pl for pl in playlists if getattr(pl, "name", None) == "House"), None)
 if not playlist:
     print("Playlist 'House' not found!")
     exit(1)
@@ -27,13 +27,14 @@ __author__ = "Your Name"
 __email__ = "your.email@example.com"
 __license__ = "MIT"
 
-# CLI interface
-from .cli import cli
+from typing import TYPE_CHECKING, Any
+
 from .core.config import Config
 from .core.exceptions import (
     AuthenticationError,
     ConfigurationError,
     DiscogsToTidalError,
+    InvalidFolderError,
     RateLimitError,
     SearchError,
     StorageError,
@@ -41,8 +42,29 @@ from .core.exceptions import (
 )
 from .core.models import Album, Artist, Playlist, SyncResult, Track
 
-# Integration services
-from .integrations import DiscogsService, TidalService
+if TYPE_CHECKING:
+    from .cli import cli
+    from .integrations import DiscogsService, TidalService
+
+# Heavy attributes pulling in click, tidalapi and discogs_client, imported on
+# first access (PEP 562) so importing the models stays cheap
+_LAZY_ATTRIBUTES = {
+    "DiscogsService": ".integrations",
+    "TidalService": ".integrations",
+    "cli": ".cli",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        import importlib
+
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # Cache so later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "__version__",
@@ -59,6 +81,7 @@ __all__ = [
     "ConfigurationError",
     "StorageError",
     "RateLimitError",
+    "InvalidFolderError",
     "DiscogsService",
     "TidalService",
     "cli",
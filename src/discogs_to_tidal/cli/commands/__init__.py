@@ -0,0 +1,3 @@
+"""
+CLI subcommands, one module per command.
+"""
@@ -0,0 +1,31 @@
+"""
+The config-info command.
+"""
+import click
+
+from ..helpers import get_config
+
+
+@click.command()
+def config_info() -> None:
+    """Display configuration information."""
+    config = get_config()
+
+    max_tracks_display = config.max_tracks if config.max_tracks > 0 else "No limit"
+    token_status = "✅ Set" if config.discogs_token else "❌ Not set"
+    lines = [
+        "⚙️  Configuration:",
+        f"  Discogs token: {token_status}",
+        f"  Max tracks: {max_tracks_display}",
+        f"  Tokens directory: {config.tokens_dir}",
+        f"  Log level: {config.log_level}",
+    ]
+
+    # Check for .env file
+    if config.env_file_present:
+        lines.append("  Environment file: ✅ Found (.env)")
+    else:
+        lines.append("  Environment file: ❌ Not found (.env)")
+        lines.append("    Create a .env file with your DISCOGS_TOKEN")
+
+    click.echo("\n".join(lines))
@@ -0,0 +1,138 @@
+"""
+The discogs-auth command.
+"""
+import getpass
+from typing import Any
+
+import click
+
+from ...integrations.discogs.client import DiscogsService
+from ..helpers import SEPARATOR, configure_logging, get_config, print_discogs_user
+
+# Token prompts before giving up, so a stuck paste can't loop forever
+_MAX_TOKEN_ATTEMPTS = 5
+
+# Static help blocks, each printed with a single echo
+_TOKEN_SETUP_HELP = "\n".join(
+    [
+        "\n🔑 Discogs Personal Access Token Setup",
+        SEPARATOR,
+        "To use this tool, you need a personal access token from Discogs.",
+        "",
+        "📋 Steps to get your token:",
+        "  1. Go to: https://www.discogs.com/settings/developers",
+        "  2. Click 'Generate new token'",
+        "  3. Copy the generated token",
+        "  4. Paste it below",
+        "",
+    ]
+)
+_TOKEN_PROMPT = "🔑 Enter your Discogs personal access token: "
+_TOKEN_CHECKLIST = "\n".join(
+    [
+        "💡 Please check that:",
+        "  - The token is copied correctly (no extra spaces)",
+        "  - The token has not expired",
+        "  - You have an active internet connection",
+    ]
+)
+
+
+@click.command()
+@click.pass_context
+def discogs_auth(ctx: click.Context) -> None:
+    """Check Discogs authorization status and setup token if needed."""
+    configure_logging(ctx)
+    config = get_config(ctx)
+
+    try:
+        click.echo("🔐 Checking Discogs authorization status...")
+
+        # One service validates the stored token and any newly entered ones
+        discogs_service = DiscogsService(config)
+
+        # Check for existing token
+        existing_token = config.get_discogs_token()
+        if existing_token:
+            click.echo("📄 Found existing Discogs token")
+
+            # Test the existing token
+            click.echo("🔍 Validating existing token...")
+            try:
+                user = _authenticated_user(discogs_service)
+                click.echo("✅ Existing Discogs token is valid!")
+                ctx.obj["discogs_service"] = discogs_service
+                print_discogs_user(user)
+                click.echo("🎉 No authentication needed - you're all set!")
+                return
+
+            except Exception as e:
+                click.echo(f"⚠️ Existing token validation failed: {e}")
+                click.echo("🔄 Will prompt for new token...")
+        else:
+            click.echo("📭 No existing Discogs token found")
+
+        # Need to get a new token
+        click.echo(_TOKEN_SETUP_HELP)
+
+        # Prompt for token, a bounded number of times
+        for attempt in range(1, _MAX_TOKEN_ATTEMPTS + 1):
+            token = getpass.getpass(_TOKEN_PROMPT).strip()
+
+            if not token:
+                click.echo("❌ Token cannot be empty. Please try again.")
+                continue
+
+            # Validate the token
+            click.echo("🔍 Validating token...")
+            try:
+                discogs_service.set_token(token)
+                user = _authenticated_user(discogs_service)
+
+                # Token is valid and session was saved by authentication process
+                click.echo("✅ Token validation successful!")
+                ctx.obj["discogs_service"] = discogs_service
+                print_discogs_user(user)
+                click.echo("💾 Session saved securely for future use")
+                click.echo("✨ You can now use 'make sync' to sync your music!")
+                return
+
+            except Exception as e:
+                click.echo(f"❌ Token validation failed: {e}")
+                click.echo(_TOKEN_CHECKLIST)
+
+                if attempt == _MAX_TOKEN_ATTEMPTS:
+                    break
+                retry = click.confirm("🔄 Would you like to try another token?")
+                if not retry:
+                    click.echo("❌ Authentication setup cancelled")
+                    ctx.exit(1)
+
+        click.echo(f"❌ No valid token after {_MAX_TOKEN_ATTEMPTS} attempts")
+        ctx.exit(1)
+
+    except click.exceptions.Exit:
+        # ctx.exit() above; not an error
+        raise
+    except KeyboardInterrupt:
+        click.echo("\n❌ Authentication setup cancelled by user")
+        ctx.exit(1)
+    except Exception as e:
+        click.echo(f"❌ Unexpected error: {e}", err=True)
+        ctx.exit(1)
+
+
+def _authenticated_user(discogs_service: DiscogsService) -> Any:
+    """
+    Authenticate with the service's current token and return the user.
+
+    Raises:
+        Exception: If authentication fails or no user information comes back
+    """
+    discogs_service.authenticate()
+
+    # Get user info to confirm token works
+    user = discogs_service.user
+    if not user:
+        raise Exception("Could not retrieve user information")
+    return user
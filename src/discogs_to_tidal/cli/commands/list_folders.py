@@ -0,0 +1,58 @@
+"""
+The list-folders command.
+"""
+import sys
+
+import click
+
+from ...core.exceptions import DiscogsToTidalError
+from ...integrations.discogs.client import DiscogsService
+from ..helpers import NARROW_SEPARATOR, configure_logging, get_config
+
+# Folder count above which an interactive listing is paged
+_PAGER_THRESHOLD = 50
+
+
+@click.command()
+@click.pass_context
+def list_folders(ctx: click.Context) -> None:
+    """List available Discogs collection folders."""
+    configure_logging(ctx)
+    config = get_config(ctx)
+
+    try:
+        # Initialize Discogs service
+        discogs_service = DiscogsService(config)
+        discogs_service.authenticate()
+
+        folders = discogs_service.get_collection_folders()
+
+        if not folders:
+            click.echo("📁 Discogs Collection Folders:")
+            click.echo(NARROW_SEPARATOR)
+            click.echo("No folders found in your Discogs collection.")
+            return
+
+        lines = ["📁 Discogs Collection Folders:", NARROW_SEPARATOR]
+        lines.extend(
+            f"  ID: {folder['id']:>3} | {folder['name']:<20} | "
+            f"{folder['count']:>4} items"
+            for folder in folders
+        )
+        lines.append(NARROW_SEPARATOR)
+        lines.append(
+            "💡 Use --folder-id <ID> with the sync command to sync a specific folder"
+        )
+
+        # Long tables go through the pager on a terminal; otherwise one write
+        if len(folders) > _PAGER_THRESHOLD and sys.stdout.isatty():
+            click.echo_via_pager("\n".join(lines) + "\n")
+        else:
+            click.echo("\n".join(lines))
+
+    except DiscogsToTidalError as e:
+        click.echo(f"❌ Failed to list folders: {e}", err=True)
+        ctx.exit(1)
+    except Exception as e:
+        click.echo(f"❌ Unexpected error: {e}", err=True)
+        ctx.exit(1)
@@ -0,0 +1,44 @@
+"""
+The style-sync command.
+"""
+from typing import Any
+
+import click
+
+from ..helpers import FOLDER_ID_OPTION, configure_logging, get_config, limit_option
+from ..sync_command import execute_style_sync_command
+
+
+@click.command("style-sync")
+@click.option(
+    "--base-name",
+    "-n",
+    default="Discogs",
+    help="Base name for style playlists (e.g., 'Discogs - House')",
+)
+@FOLDER_ID_OPTION
+@limit_option("Maximum number of tracks to process")
+@click.pass_context
+def style_sync(ctx: Any, base_name: str, folder_id: int, limit: int) -> None:
+    """Create Tidal playlists organized by styles/subgenres from Discogs.
+
+    This command creates multiple playlists based on the styles (subgenres)
+    found in your Discogs collection. Tracks from albums with multiple
+    styles will be added to multiple playlists.
+
+    Example: If you have albums with styles like "House", "Deep House", and
+    "Techno", this will create playlists named:
+    - "Discogs - House"
+    - "Discogs - Deep House"
+    - "Discogs - Techno"
+    """
+    configure_logging(ctx)
+    config = get_config(ctx)
+    execute_style_sync_command(
+        config,
+        base_name,
+        folder_id,
+        limit,
+        discogs_service=ctx.obj.get("discogs_service"),
+        tidal_service=ctx.obj.get("tidal_service"),
+    )
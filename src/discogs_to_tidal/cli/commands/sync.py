@@ -0,0 +1,46 @@
+"""
+The sync command.
+"""
+from typing import Any
+
+import click
+
+from ..helpers import FOLDER_ID_OPTION, configure_logging, get_config, limit_option
+from ..sync_command import execute_sync_command
+
+
+@click.command()
+@click.option(
+    "--playlist-name",
+    "-p",
+    default="My Discogs Collection",
+    help="Name for the Tidal playlist",
+)
+@FOLDER_ID_OPTION
+@limit_option("Maximum number of tracks to sync")
+@click.option(
+    "--dry-run", is_flag=True, help="Show what would be synced without making changes"
+)
+@click.pass_context
+def sync(
+    ctx: Any, playlist_name: str, folder_id: int, limit: int, dry_run: bool
+) -> None:
+    """Sync Discogs collection to Tidal playlist."""
+    configure_logging(ctx)
+    config = get_config(ctx)
+
+    # Reuse a Tidal login from tidal-auth, or from test-auth's TidalService
+    tidal_auth = ctx.obj.get("tidal_auth")
+    tidal_service = ctx.obj.get("tidal_service")
+    if tidal_auth is None and tidal_service is not None:
+        tidal_auth = tidal_service.auth
+
+    execute_sync_command(
+        config,
+        playlist_name,
+        folder_id,
+        limit,
+        dry_run,
+        discogs_service=ctx.obj.get("discogs_service"),
+        tidal_auth=tidal_auth,
+    )
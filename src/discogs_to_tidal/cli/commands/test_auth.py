@@ -0,0 +1,57 @@
+"""
+The test-auth command.
+"""
+import click
+
+from ...core.exceptions import DiscogsToTidalError
+from ...integrations.discogs.client import DiscogsService
+from ...integrations.tidal.client import TidalService
+from ..helpers import (
+    SEPARATOR,
+    auth_progress,
+    configure_logging,
+    get_config,
+    print_tidal_user,
+)
+
+
+@click.command()
+@click.pass_context
+def test_auth(ctx: click.Context) -> None:
+    """Test authentication with both services using improved authentication flow."""
+    configure_logging(ctx)
+    config = get_config(ctx)
+
+    try:
+        # Test Discogs
+        click.echo("🔐 Testing Discogs authentication...")
+        discogs_service = DiscogsService(config)
+        discogs_service.authenticate()
+        click.echo("✅ Discogs authentication successful")
+        ctx.obj["discogs_service"] = discogs_service
+
+        # Test Tidal with progress feedback
+        click.echo("\n🔐 Testing Tidal authentication with progress feedback...")
+        click.echo(SEPARATOR)
+
+        tidal_service = TidalService(config)
+
+        # Test new authentication with progress
+        if tidal_service.authenticate_with_progress(auth_progress):
+            click.echo("🎉 Tidal authentication successful!")
+            ctx.obj["tidal_service"] = tidal_service
+
+            # Show some basic info if available
+            print_tidal_user(tidal_service.session)
+        else:
+            click.echo("❌ Tidal authentication failed!")
+            ctx.exit(1)
+
+        click.echo("\n🎉 Both services authenticated successfully!")
+
+    except DiscogsToTidalError as e:
+        click.echo(f"❌ Authentication failed: {e}", err=True)
+        ctx.exit(1)
+    except Exception as e:
+        click.echo(f"❌ Unexpected error: {e}", err=True)
+        ctx.exit(1)
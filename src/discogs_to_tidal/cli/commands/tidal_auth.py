@@ -0,0 +1,97 @@
+"""
+The tidal-auth command.
+"""
+import time
+
+import click
+
+from ...core.exceptions import DiscogsToTidalError
+from ...integrations.tidal.auth import TidalAuth
+from ..helpers import (
+    SEPARATOR,
+    auth_progress,
+    configure_logging,
+    get_config,
+    print_tidal_user,
+)
+
+# Seconds of remaining validity needed to skip the online session check
+_EXPIRY_MARGIN = 60
+
+
+@click.command()
+@click.pass_context
+def tidal_auth(ctx: click.Context) -> None:
+    """Check Tidal authorization status and authenticate if needed."""
+    configure_logging(ctx)
+    config = get_config(ctx)
+
+    try:
+        click.echo("🔐 Checking Tidal authorization status...")
+
+        # Initialize Tidal auth
+        tidal_auth = TidalAuth(config)
+
+        # Check for existing valid session
+        session_data = tidal_auth.load_session()
+        if session_data:
+            click.echo("📄 Found existing session data")
+
+            # A session well inside its saved expiry is trusted without a
+            # network round-trip; commands that use it still re-authenticate
+            # if Tidal rejects it.
+            if session_data.get("expires_at", 0) > time.time() + _EXPIRY_MARGIN:
+                click.echo("✅ Existing Tidal session is valid!")
+                user_id = session_data.get("user_id") or "Unknown"
+                country = session_data.get("country_code") or "Unknown"
+                click.echo(f"👤 Logged in as: {user_id}")
+                click.echo(f"🌍 Country: {country}")
+                click.echo("🎉 No authentication needed - you're all set!")
+                return
+
+            # Try to validate existing session
+            try:
+                session = tidal_auth._try_existing_session()
+                if session:
+                    click.echo("✅ Existing Tidal session is valid!")
+
+                    # Show user info if available
+                    print_tidal_user(session)
+
+                    click.echo("🎉 No authentication needed - you're all set!")
+                    return
+                else:
+                    click.echo("⚠️ Existing session is invalid or expired")
+            except Exception as e:
+                click.echo(f"⚠️ Could not validate existing session: {e}")
+        else:
+            click.echo("📭 No existing session found")
+
+        # Need to authenticate
+        click.echo("\n🔐 Starting Tidal authentication process...")
+        click.echo(SEPARATOR)
+
+        tidal_auth.set_progress_callback(auth_progress)
+
+        # Perform authentication
+        session = tidal_auth.authenticate(force_new=True)
+
+        if session and tidal_auth.validate_session(session):
+            click.echo("\n🎉 Tidal authentication successful!")
+            ctx.obj["tidal_auth"] = tidal_auth
+
+            # Show user info
+            print_tidal_user(session)
+
+            click.echo("💾 Session saved for future use")
+            click.echo("✨ You can now use 'make sync' to sync your music!")
+        else:
+            click.echo("❌ Authentication failed!")
+            ctx.exit(1)
+
+    except DiscogsToTidalError as e:
+        click.echo(f"❌ Authentication error: {e}", err=True)
+        ctx.exit(1)
+    except Exception as e:
+        click.echo(f"❌ Unexpected error: {e}", err=True)
+        ctx.exit(1)
@@ -0,0 +1,219 @@
+"""
+Shared helpers for CLI commands.
+"""
+import functools
+import logging
+import os
+import sys
+from contextlib import contextmanager
+from typing import IO, Any, Callable, Iterator, Optional, Tuple
+
+import click
+
+from ..core.config import Config
+
+# Section separators shared by the command output
+SEPARATOR = "=" * 50
+NARROW_SEPARATOR = "=" * 40
+
+# Options shared by sync and style-sync
+FOLDER_ID_OPTION = click.option(
+    "--folder-id",
+    "-f",
+    default=None,
+    type=int,
+    help="Discogs collection folder ID (skip for interactive selection)",
+)
+_TRACK_LIMIT = click.IntRange(1, None)
+
+# Prefixes for the stages reported by auth_progress
+_PROGRESS_START = "🔐 "
+_PROGRESS_WAIT = "⏳ "
+_PROGRESS_DONE = "✅ "
+
+# Prefix by rounded-up tens of percent: 0-30 start, 31-90 wait, 91-100 done
+_PROGRESS_PREFIXES = (_PROGRESS_START,) * 4 + (_PROGRESS_WAIT,) * 6 + (_PROGRESS_DONE,)
+
+# (attribute, label) pairs shown for a logged-in user
+_TIDAL_USER_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("id", "👤 Logged in as: "),
+    ("country_code", "🌍 Country: "),
+)
+_DISCOGS_USER_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("username", "👤 Logged in as: "),
+    ("num_collection", "📊 Collection items: "),
+)
+
+# Environment variables read by Config.from_env()
+_CONFIG_ENV_VARS = (
+    "DISCOGS_TOKEN",
+    "LOG_LEVEL",
+    "MAX_TRACKS",
+    "CACHE_TRACKS",
+    "CACHE_EXPIRY_HOURS",
+    "SEARCH_TIMEOUT",
+    "SEARCH_RETRY_COUNT",
+    "DEV_MODE",
+    "DEBUG_API_CALLS",
+)
+
+_logging_configured = False
+
+# Stdout stream used by fast_echo, and the sys.stdout it was resolved for
+_stdout: Optional[IO[Any]] = None
+_stdout_source: Any = None
+
+
+def configure_logging(ctx: click.Context) -> None:
+    """
+    Install the root log handler for commands that produce log output.
+
+    Uses the level chosen by --verbose/--debug on the group. Safe to call
+    more than once; only the first call has an effect.
+
+    Args:
+        ctx: Click context of the running command
+    """
+    global _logging_configured
+    if _logging_configured:
+        return
+
+    level = ctx.obj.get("log_level", logging.WARNING)
+    root = logging.getLogger()
+    if root.handlers:
+        # Someone already installed handlers; just apply the chosen level
+        root.setLevel(level)
+    else:
+        logging.basicConfig(
+            level=level,
+            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        )
+    _logging_configured = True
+
+
+def get_config(ctx: Optional[click.Context] = None) -> Config:
+    """
+    Return the configuration for this invocation, loading it on first use.
+
+    The group callback doesn't build the config up front, so help output and
+    shell completion never touch the environment or the token storage.
+
+    Args:
+        ctx: Click context of the running command; defaults to the current one
+
+    Returns:
+        The loaded configuration
+    """
+    if ctx is None:
+        ctx = click.get_current_context()
+    config: Optional[Config] = ctx.obj.get("config")
+    if config is None:
+        try:
+            # Each invocation gets its own copy, so per-run state never leaks
+            config = _load_config(_config_cache_key()).copy()
+        except Exception as e:
+            click.echo(f"Error loading configuration: {e}", err=True)
+            ctx.exit(1)
+        ctx.obj["config"] = config
+    return config
+
+
+def limit_option(help_text: str) -> Callable[[Any], Any]:
+    """Build the shared --limit option with a command-specific help text."""
+    return click.option(
+        "--limit", "-l", default=None, type=_TRACK_LIMIT, help=help_text
+    )
+
+
+def _config_cache_key() -> Tuple[Any, ...]:
+    """Key identifying the inputs to Config.from_env() and the .env check."""
+    try:
+        env_file_mtime: Optional[float] = os.path.getmtime(".env")
+    except OSError:
+        env_file_mtime = None
+    env_values = tuple(os.environ.get(name) for name in _CONFIG_ENV_VARS)
+    # The project root (and so the tokens directory) is found from the cwd
+    return env_values + (env_file_mtime, os.getcwd())
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config(key: Tuple[Any, ...]) -> Config:
+    """
+    Build a Config, reusing it while the environment, .env and cwd are unchanged.
+
+    The cached instance is a template; callers use a copy() of it.
+    """
+    return Config.from_env()
+
+
+def fast_echo(message: str) -> None:
+    """
+    Write one line to stdout, skipping click.echo's per-call setup.
+
+    Meant for progress callbacks that fire once per track; one-off output
+    should keep using click.echo. The stream is re-resolved whenever
+    sys.stdout is swapped (e.g. by click's CliRunner).
+
+    Args:
+        message: Line to print, without trailing newline
+    """
+    global _stdout, _stdout_source
+    stream = _stdout
+    if stream is None or _stdout_source is not sys.stdout:
+        _stdout_source = sys.stdout
+        stream = click.get_text_stream("stdout")
+        _stdout = stream
+    stream.write(message + "\n")
+    stream.flush()
+
+
+def auth_progress(message: str, progress: int) -> None:
+    """
+    Progress callback for Tidal authentication.
+
+    Args:
+        message: Status message from the authenticator
+        progress: Completion percentage (0-100)
+    """
+    index = min(10, max(0, (progress + 9) // 10))
+    fast_echo(_PROGRESS_PREFIXES[index] + message)
+
+
+def print_tidal_user(session: Any) -> None:
+    """
+    Echo the logged-in Tidal user's id and country, if the session has a user.
+
+    Args:
+        session: Authenticated tidalapi session
+    """
+    with _user_info_errors():
+        user = getattr(session, "user", None)
+        if user:
+            click.echo(_format_user(user, _TIDAL_USER_FIELDS))
+
+
+def print_discogs_user(user: Any) -> None:
+    """
+    Echo the Discogs user's name and collection size.
+
+    Args:
+        user: Authenticated Discogs user object
+    """
+    with _user_info_errors():
+        click.echo(_format_user(user, _DISCOGS_USER_FIELDS))
+
+
+@contextmanager
+def _user_info_errors() -> Iterator[None]:
+    """Report failures to read user details instead of aborting the command."""
+    try:
+        yield
+    except Exception as e:
+        click.echo(f"👤 User info not available: {e}")
+
+
+def _format_user(user: Any, fields: Tuple[Tuple[str, str], ...]) -> str:
+    """Render one labelled line per field, using "Unknown" for missing ones."""
+    return "\n".join(
+        f"{label}{getattr(user, attr, 'Unknown')}" for attr, label in fields
+    )
@@ -5,96 +5,235 @@ This module contains all the CLI presentation logic, user interaction,
 and formatting for the sync command, while delegating the actual sync
 business logic to the core SyncService.
 """
-from typing import Callable, Dict, Optional, Tuple
+import heapq
+import itertools
+import re
+import shutil
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
 import click
 
 from ..core.config import Config
-from ..core.exceptions import DiscogsToTidalError
-from ..core.models import SyncResult
+from ..core.exceptions import DiscogsToTidalError, InvalidFolderError
+from ..core.models import Album, SyncResult, Track
 from ..core.sync import SyncService
 from ..integrations.discogs.client import DiscogsService
 from ..integrations.tidal.auth import TidalAuth
 from ..integrations.tidal.client import TidalService
+from ..integrations.tidal.search_cache import SearchCache
+from .helpers import auth_progress, fast_echo
+
+_T = TypeVar("_T")
+
+# Per-item progress lines ("Fetching release 3/120: ...") are printed at most
+# this often, in seconds; the first and last item of a run always show
+_PROGRESS_INTERVAL = 0.1
+_ITEM_PROGRESS = re.compile(r" (\d+)/(\d+): ")
+_last_item_progress = 0.0
+
+# Table rules and headers for the folder picker and style sync report
+_FOLDER_SEPARATOR = "=" * 70
+_FOLDER_DIVIDER = "-" * 70
+_FOLDER_HEADER = f"{'Index':<8} | {'Folder Name':<30} | {'Items':<10}"
+_STYLE_SEPARATOR = "=" * 80
+_STYLE_DIVIDER = "-" * 80
+_STYLE_HEADER = f"{'Style':<30} | {'Found':<8} | {'Added':<8} | {'Failed':<8}"
+
+# On a terminal, style tables longer than this only show the first screenful
+_STYLE_ROWS_THRESHOLD = 50
+
+# Spinner shown on a terminal while a background step runs
+_SPINNER_FRAMES = "|/-\\"
+_SPINNER_INTERVAL = 0.1
+
+
+class _CommandServices:
+    """
+    Services for one command, each built on first access.
+
+    style-sync never touches the TidalAuth/SyncService pair and plain sync
+    never needs a TidalService, so nothing is constructed (or, for the
+    Discogs service, the HTTP cache opened) until a step asks for it.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        discogs_service: Optional[DiscogsService] = None,
+        tidal_auth: Optional[TidalAuth] = None,
+        tidal_service: Optional[TidalService] = None,
+    ) -> None:
+        self.config = config
+        self._discogs_service = discogs_service
+        self._tidal_auth = tidal_auth
+        self._tidal_service = tidal_service
+        self._sync_service: Optional[SyncService] = None
+
+    @staticmethod
+    def _build(factory: Callable[[], _T]) -> _T:
+        """Call a service factory, reporting failures as sync errors."""
+        try:
+            return factory()
+        except Exception as e:
+            raise DiscogsToTidalError(f"Failed to initialize services: {e}")
+
+    @property
+    def discogs_service(self) -> DiscogsService:
+        """Get the Discogs service."""
+        if self._discogs_service is None:
+            self._discogs_service = self._build(lambda: DiscogsService(self.config))
+        return self._discogs_service
+
+    @property
+    def tidal_auth(self) -> TidalAuth:
+        """Get the Tidal authenticator used by the sync service."""
+        if self._tidal_auth is None:
+            self._tidal_auth = self._build(lambda: TidalAuth(self.config))
+        return self._tidal_auth
+
+    @property
+    def tidal_service(self) -> TidalService:
+        """Get the Tidal service used for style-based playlists."""
+        if self._tidal_service is None:
+            self._tidal_service = self._build(lambda: TidalService(self.config))
+        return self._tidal_service
+
+    @property
+    def sync_service(self) -> SyncService:
+        """Get the sync service, creating its dependencies as needed."""
+        if self._sync_service is None:
+            discogs_service, tidal_auth = self.discogs_service, self.tidal_auth
+            self._sync_service = self._build(
+                lambda: SyncService(
+                    discogs_service,
+                    tidal_auth,
+                    search_cache=self._search_cache(),
+                )
+            )
+        return self._sync_service
+
+    def _search_cache(self) -> Optional[SearchCache]:
+        """Build the Tidal search cache if track caching is enabled."""
+        if not self.config.cache_tracks:
+            return None
+        return SearchCache.from_config(self.config)
 
 
 def initialize_services(
     config: Config,
-) -> Tuple[DiscogsService, TidalAuth, SyncService]:
-    """Initialize and return Discogs and Tidal services."""
-    try:
-        discogs_service = DiscogsService(config)
-        tidal_auth = TidalAuth(config)
-        sync_service = SyncService(discogs_service, tidal_auth)
-        return discogs_service, tidal_auth, sync_service
-    except Exception as e:
-        raise DiscogsToTidalError(f"Failed to initialize services: {e}")
+    discogs_service: Optional[DiscogsService] = None,
+    tidal_auth: Optional[TidalAuth] = None,
+    tidal_service: Optional[TidalService] = None,
+) -> _CommandServices:
+    """
+    Return the services for a command, built lazily on first access.
+
+    Services passed in (already authenticated by an earlier command in the
+    same process) are reused instead of being rebuilt.
+    """
+    return _CommandServices(config, discogs_service, tidal_auth, tidal_service)
 
 
-def select_discogs_folder(discogs_service: DiscogsService) -> int:
+class _FolderCache:
+    """
+    Collection folders fetched at most once per command.
+
+    Folder selection, validation and display all need the folder list;
+    sharing one instance saves the repeated Discogs round-trips. A failed
+    fetch isn't cached, so the next caller tries again.
+    """
+
+    def __init__(self, discogs_service: DiscogsService) -> None:
+        self._discogs_service = discogs_service
+        self._folders: Optional[List[Dict[str, Any]]] = None
+        self._folders_by_id: Optional[Dict[int, Dict[str, Any]]] = None
+
+    def get(self) -> List[Dict[str, Any]]:
+        """Return the collection folders, fetching them on first use."""
+        if self._folders is None:
+            self._folders = self._discogs_service.get_collection_folders()
+        return self._folders
+
+    def by_id(self) -> Dict[int, Dict[str, Any]]:
+        """Return the collection folders keyed by folder ID."""
+        if self._folders_by_id is None:
+            self._folders_by_id = {folder["id"]: folder for folder in self.get()}
+        return self._folders_by_id
+
+
+def _wait_with_spinner(future: "Future[_T]") -> _T:
+    """Return the future's result, spinning on a terminal until it's ready."""
+    if sys.stdout.isatty():
+        frames = itertools.cycle(_SPINNER_FRAMES)
+        spun = False
+        while not wait([future], timeout=_SPINNER_INTERVAL).done:
+            click.echo(f"\r{next(frames)} ", nl=False)
+            spun = True
+        if spun:
+            click.echo("\r  \r", nl=False)
+    return future.result()
+
+
+def select_discogs_folder(
+    discogs_service: DiscogsService, folder_cache: Optional[_FolderCache] = None
+) -> int:
     """Interactive folder selection for Discogs collection."""
     click.echo("\n📁 Discovering your Discogs collection folders...")
 
+    cache = folder_cache or _FolderCache(discogs_service)
+
     try:
-        # Authenticate first
+        # Authenticate first, on this thread: it may prompt for a token
         discogs_service.authenticate()
 
-        # Get available folders
-        folders = discogs_service.get_collection_folders()
+        # Fetch in the background so a spinner can run meanwhile
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            folders = _wait_with_spinner(executor.submit(cache.get))
 
         if not folders:
             click.echo("❌ No folders found in your Discogs collection.")
             return 0
 
         # Display folders with array index mapping but return actual folder IDs
-        click.echo("\n📋 Available Discogs folders:")
-        click.echo("=" * 70)
-        click.echo(f"{'Index':<8} | {'Folder Name':<30} | {'Items':<10}")
-        click.echo("-" * 70)
-
-        # Create mapping between display index and actual folder ID
-        index_to_folder_id = {}
-        for i, folder in enumerate(folders):
-            folder_line = (
-                f"{i:<8} | {folder['name']:<30} | " f"{folder['count']:>4} items"
+        lines = [
+            "\n📋 Available Discogs folders:",
+            _FOLDER_SEPARATOR,
+            _FOLDER_HEADER,
+            _FOLDER_DIVIDER,
+        ]
+        lines.extend(
+            f"{i:<8} | {folder['name']:<30} | " f"{folder['count']:>4} items"
+            for i, folder in enumerate(folders)
+        )
+        lines.append(_FOLDER_SEPARATOR)
+        lines.append("💡 Use the Index number to select a folder")
+
+        # One write for the whole table
+        click.echo("\n".join(lines))
+
+        # Get user selection; click re-prompts on anything outside the range
+        try:
+            folder_choice = click.prompt(
+                "\n🎯 Select folder Index to sync",
+                type=click.IntRange(0, len(folders) - 1),
+                default=0,
             )
-            click.echo(folder_line)
-            # Map display index to actual Discogs folder ID
-            index_to_folder_id[i] = folder["id"]
-
-        click.echo("=" * 70)
-        click.echo("💡 Use the Index number to select a folder")
-
-        # Get user selection
-        while True:
-            try:
-                folder_choice = click.prompt(
-                    "\n🎯 Select folder Index to sync", type=int, default=0
-                )
+        except click.Abort:
+            click.echo("\n❌ Folder selection cancelled.")
+            raise click.ClickException("Folder selection required for sync.")
 
-                # Validate choice using array indices
-                if folder_choice in index_to_folder_id:
-                    actual_folder_id = index_to_folder_id[folder_choice]
-                    selected_folder = folders[folder_choice]
-                    folder_info = (
-                        f"✅ Selected: {selected_folder['name']} "
-                        f"({selected_folder['count']} items)"
-                    )
-                    click.echo(folder_info)
-                    # Return the actual Discogs folder ID (not the array index)
-                    return int(actual_folder_id)
-                else:
-                    valid_indices = list(range(len(folders)))
-                    valid_indices_str = ", ".join(map(str, valid_indices))
-                    click.echo(
-                        f"❌ Invalid folder index. Choose from: {valid_indices_str}"
-                    )
-
-            except click.Abort:
-                click.echo("\n❌ Folder selection cancelled.")
-                raise click.ClickException("Folder selection required for sync.")
-            except (ValueError, TypeError):
-                click.echo("❌ Please enter a valid number.")
+        selected_folder = folders[folder_choice]
+        click.echo(
+            f"✅ Selected: {selected_folder['name']} "
+            f"({selected_folder['count']} items)"
+        )
+        # Return the actual Discogs folder ID (not the array index)
+        return int(selected_folder["id"])
 
     except Exception as e:
         click.echo(f"❌ Error fetching folders: {e}")
@@ -103,22 +242,22 @@ def select_discogs_folder(discogs_service: DiscogsService) -> int:
 
 
 def resolve_folder_selection(
-    discogs_service: DiscogsService, folder_id: Optional[int]
+    discogs_service: DiscogsService,
+    folder_id: Optional[int],
+    folder_cache: Optional[_FolderCache] = None,
 ) -> int:
     """Resolve folder selection through interactive selection or validation."""
+    if folder_cache is None:
+        folder_cache = _FolderCache(discogs_service)
     try:
         if folder_id is None:
-            return select_discogs_folder(discogs_service)
+            return select_discogs_folder(discogs_service, folder_cache)
 
         # Validate provided folder_id exists
-        folders = discogs_service.get_collection_folders()
-        valid_folder_ids = {folder["id"] for folder in folders}
+        folders_by_id = folder_cache.by_id()
 
-        if folder_id not in valid_folder_ids:
-            available = ", ".join(f"ID {fid}" for fid in sorted(valid_folder_ids))
-            raise DiscogsToTidalError(
-                f"Invalid folder ID {folder_id}. Available: {available}"
-            )
+        if folder_id not in folders_by_id:
+            raise InvalidFolderError(folder_id, folders_by_id)
 
         return folder_id
     except DiscogsToTidalError:
@@ -127,11 +266,15 @@ def resolve_folder_selection(
         raise DiscogsToTidalError(f"Failed to resolve folder selection: {e}")
 
 
-def display_folder_info(discogs_service: DiscogsService, folder_id: int) -> None:
+def display_folder_info(
+    discogs_service: DiscogsService,
+    folder_id: int,
+    folder_cache: Optional[_FolderCache] = None,
+) -> None:
     """Display information about the selected folder."""
     try:
-        folders = discogs_service.get_collection_folders()
-        selected_folder = next((f for f in folders if f["id"] == folder_id), None)
+        folders_by_id = (folder_cache or _FolderCache(discogs_service)).by_id()
+        selected_folder = folders_by_id.get(folder_id)
 
         if selected_folder:
             click.echo(
@@ -155,39 +298,127 @@ def display_sync_parameters(
         click.echo("🧪 Dry run mode: No tracks will be added")
 
 
-def setup_progress_callbacks() -> (
-    Tuple[Callable[[str, int], None], Callable[[str], None]]
-):
-    """Setup progress callback functions for authentication and sync."""
+def echo_progress(message: str) -> None:
+    """Progress callback for fetching and syncing."""
+    global _last_item_progress
 
-    def auth_progress(message: str, progress: int) -> None:
-        if progress <= 30:
-            click.echo(f"🔐 {message}")
-        elif progress <= 90:
-            click.echo(f"⏳ {message}")
-        else:
-            click.echo(f"✅ {message}")
+    match = _ITEM_PROGRESS.search(message)
+    if match and match.group(1) not in ("1", match.group(2)):
+        now = time.monotonic()
+        if now - _last_item_progress < _PROGRESS_INTERVAL:
+            return
+        _last_item_progress = now
 
-    def progress_callback(message: str) -> None:
-        click.echo(f"⏳ {message}")
+    fast_echo(f"⏳ {message}")
 
-    return auth_progress, progress_callback
+
+def setup_progress_callbacks() -> (
+    Tuple[Callable[[str, int], None], Callable[[str], None]]
+):
+    """Return the progress callbacks for authentication and sync."""
+    return auth_progress, echo_progress
 
 
 def authenticate_services(tidal_auth: TidalAuth) -> None:
     """Authenticate with external services."""
     try:
         click.echo("🔐 Authenticating with Tidal...")
-        tidal_auth.authenticate()
+        # Only logs in if this TidalAuth doesn't hold a session yet
+        tidal_auth.session
     except Exception as e:
         raise DiscogsToTidalError(f"Tidal authentication failed: {e}")
 
 
+def authenticate_and_prefetch(
+    tidal_auth: TidalAuth,
+    sync_service: SyncService,
+    folder_id: int,
+    progress_callback: Callable[[str], None],
+) -> List[Tuple[Album, List[Track]]]:
+    """
+    Authenticate with Tidal while the Discogs collection is fetched.
+
+    The two are independent network-bound steps, so running them side by
+    side costs the longer of the two rather than their sum. Tidal login
+    stays on the calling thread since it may need user interaction; the
+    fetch's progress messages are held back until it's done so they don't
+    get mixed into the login instructions. If login fails the fetch is
+    stopped and the error is raised without waiting for it.
+    """
+    lock = threading.Lock()
+    held_messages: List[str] = []
+    logging_in = True
+
+    def quiet_progress(message: str) -> None:
+        with lock:
+            if logging_in:
+                held_messages.append(message)
+            else:
+                progress_callback(message)
+
+    sync_service.discogs_service.reset_collection_fetch()
+    executor = ThreadPoolExecutor(max_workers=1)
+    albums_future = executor.submit(
+        sync_service.prefetch_discogs, folder_id, quiet_progress
+    )
+    try:
+        authenticate_services(tidal_auth)
+    except BaseException:
+        albums_future.cancel()
+        sync_service.discogs_service.cancel_collection_fetch()
+        executor.shutdown(wait=False)
+        raise
+
+    with lock:
+        logging_in = False
+        for message in held_messages:
+            progress_callback(message)
+
+    try:
+        return albums_future.result()
+    except Exception as e:
+        raise DiscogsToTidalError(f"Failed to fetch Discogs collection: {e}")
+    finally:
+        executor.shutdown()
+
+
+def authenticate_concurrently(
+    discogs_service: Optional[DiscogsService],
+    tidal_service: Optional[TidalService],
+    auth_progress: Callable[[str, int], None],
+) -> None:
+    """
+    Authenticate with Discogs and Tidal side by side.
+
+    Discogs logs in on a worker thread while Tidal, which may need the user
+    to open a login link, stays on the calling thread. Progress messages from
+    both go through one lock so they don't interleave. Pass None for a
+    service that is already authenticated.
+    """
+    lock = threading.Lock()
+
+    def locked_progress(message: str, progress: int) -> None:
+        with lock:
+            auth_progress(message, progress)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        discogs_future = (
+            executor.submit(discogs_service.authenticate_with_progress, locked_progress)
+            if discogs_service is not None
+            else None
+        )
+        if tidal_service is not None:
+            tidal_service.authenticate_with_progress(locked_progress)
+        if discogs_future is not None:
+            discogs_future.result()
+
+
 def perform_sync(
     sync_service: SyncService,
     progress_callback: Callable[[str], None],
     playlist_name: str,
     folder_id: int,
+    preloaded_albums: Optional[List[Tuple[Album, List[Track]]]] = None,
 ) -> SyncResult:
     """Perform the actual synchronization."""
     try:
@@ -195,6 +426,7 @@ def perform_sync(
             progress_callback=progress_callback,
             playlist_name=playlist_name,
             folder_id=folder_id,
+            preloaded_albums=preloaded_albums,
         )
     except Exception as e:
         raise DiscogsToTidalError(f"Sync operation failed: {e}")
@@ -202,40 +434,51 @@ def perform_sync(
 
 def display_sync_results(result: SyncResult, dry_run: bool) -> None:
     """Display comprehensive sync results to user."""
-    click.echo("\n📊 Sync Results:")
-    click.echo(f"  Total tracks: {result.total_tracks}")
-    click.echo(f"  Found on Tidal: {result.found_tracks}")
+    # A failed sync also reports zero tracks; surface its errors instead
+    if not result.success:
+        for error in result.errors or []:
+            click.echo(f"❌ {error}")
+        raise DiscogsToTidalError("sync did not complete")
+
+    if result.total_tracks == 0:
+        click.echo("\n📊 No tracks to sync.")
+        return
+
+    lines = [
+        "\n📊 Sync Results:",
+        f"  Total tracks: {result.total_tracks}",
+        f"  Found on Tidal: {result.found_tracks}",
+    ]
 
     if dry_run:
-        click.echo(f"  Would add: {result.found_tracks}")
+        lines.append(f"  Would add: {result.found_tracks}")
     else:
-        click.echo(f"  Added to playlist: {result.added_tracks}")
+        lines.append(f"  Added to playlist: {result.added_tracks}")
 
-    click.echo(f"  Failed: {result.failed_tracks}")
+    lines.append(f"  Failed: {result.failed_tracks}")
 
     # Calculate and display success rate
-    success_rate = (
-        (result.found_tracks / result.total_tracks * 100)
-        if result.total_tracks > 0
-        else 0
-    )
-    click.echo(f"  Success rate: {success_rate:.1f}%")
+    success_rate = result.found_tracks / result.total_tracks * 100
+    lines.append(f"  Success rate: {success_rate:.1f}%")
 
     # Show warnings and completion messages
     if result.failed_tracks > 0:
-        click.echo(f"\n⚠️  {result.failed_tracks} tracks could not be found on Tidal")
+        lines.append(f"\n⚠️  {result.failed_tracks} tracks could not be found on Tidal")
 
     if dry_run:
-        click.echo(
+        lines.append(
             f"\n✅ Dry run completed! {result.found_tracks} tracks "
             f"would be added to '{result.playlist_name}'."
         )
     else:
-        click.echo(
+        lines.append(
             f"\n✅ Sync completed! Playlist '{result.playlist_name}' "
             f"updated with {result.added_tracks} tracks."
         )
 
+    # One write for the whole block
+    click.echo("\n".join(lines))
+
 
 def execute_sync_command(
     config: Config,
@@ -243,12 +486,15 @@ def execute_sync_command(
     folder_id: Optional[int],
     limit: Optional[int],
     dry_run: bool,
+    discogs_service: Optional[DiscogsService] = None,
+    tidal_auth: Optional[TidalAuth] = None,
 ) -> None:
     """
     Execute the sync command with all necessary steps.
 
     This is the main orchestrator function that ties together all the
     sync command logic while keeping it separated from the Click decorators.
+    Authenticated services from earlier commands can be passed in for reuse.
     """
     # Validate and sanitize playlist name
     if not playlist_name or not playlist_name.strip():
@@ -258,28 +504,38 @@ def execute_sync_command(
     click.echo(f"🎵 Syncing Discogs collection to Tidal playlist: {playlist_name}")
 
     try:
-        # Initialize services
-        discogs_service, tidal_auth, sync_service = initialize_services(config)
+        # Services are created as the steps below first use them
+        services = initialize_services(config, discogs_service, tidal_auth)
+        discogs_service = services.discogs_service
 
         # Resolve folder selection (interactive or validate provided)
-        resolved_folder_id = resolve_folder_selection(discogs_service, folder_id)
+        folder_cache = _FolderCache(discogs_service)
+        resolved_folder_id = resolve_folder_selection(
+            discogs_service, folder_id, folder_cache
+        )
 
         # Display sync parameters
-        display_folder_info(discogs_service, resolved_folder_id)
+        display_folder_info(discogs_service, resolved_folder_id, folder_cache)
         display_sync_parameters(playlist_name, limit, dry_run)
 
         # Setup progress callbacks
         auth_progress, progress_callback = setup_progress_callbacks()
 
-        # Authenticate services
-        authenticate_services(tidal_auth)
+        # Authenticate with Tidal while the Discogs collection downloads
+        albums = authenticate_and_prefetch(
+            services.tidal_auth,
+            services.sync_service,
+            resolved_folder_id,
+            progress_callback,
+        )
 
         # Perform sync operation
         result = perform_sync(
-            sync_service,
+            services.sync_service,
             progress_callback,
             playlist_name,
             resolved_folder_id,
+            preloaded_albums=albums,
         )
 
         # Display results
@@ -300,59 +556,81 @@ def display_style_sync_results(
     results: Dict[str, SyncResult], base_playlist_name: str
 ) -> None:
     """Display comprehensive results for style-based sync."""
-    click.echo("\n📊 Style-based Sync Results:")
-    click.echo("=" * 80)
-
     total_playlists = len(results)
-    successful_playlists = sum(1 for r in results.values() if r.success)
-    total_tracks = sum(r.total_tracks for r in results.values())
-    total_found = sum(r.found_tracks for r in results.values())
-    total_added = sum(r.added_tracks for r in results.values())
-    total_failed = sum(r.failed_tracks for r in results.values())
+
+    # Totals in one pass over the results
+    successful_playlists = total_tracks = total_found = 0
+    total_added = total_failed = 0
+    for r in results.values():
+        successful_playlists += r.success
+        total_tracks += r.total_tracks
+        total_found += r.found_tracks
+        total_added += r.added_tracks
+        total_failed += r.failed_tracks
 
     # Summary
-    click.echo(f"  Playlists created: {successful_playlists}/{total_playlists}")
-    click.echo(f"  Total tracks processed: {total_tracks}")
-    click.echo(f"  Total tracks found on Tidal: {total_found}")
-    click.echo(f"  Total tracks added: {total_added}")
-    click.echo(f"  Total failed: {total_failed}")
+    lines = [
+        "\n📊 Style-based Sync Results:",
+        _STYLE_SEPARATOR,
+        f"  Playlists created: {successful_playlists}/{total_playlists}",
+        f"  Total tracks processed: {total_tracks}",
+        f"  Total tracks found on Tidal: {total_found}",
+        f"  Total tracks added: {total_added}",
+        f"  Total failed: {total_failed}",
+    ]
 
     if total_tracks > 0:
         success_rate = (total_found / total_tracks) * 100
-        click.echo(f"  Overall success rate: {success_rate:.1f}%")
+        lines.append(f"  Overall success rate: {success_rate:.1f}%")
 
     # Per-style breakdown
-    click.echo("\n📋 Per-style breakdown:")
-    click.echo(f"{'Style':<30} | {'Found':<8} | {'Added':<8} | {'Failed':<8}")
-    click.echo("-" * 80)
+    lines.append("\n📋 Per-style breakdown:")
+    lines.append(_STYLE_HEADER)
+    lines.append(_STYLE_DIVIDER)
+
+    # Full sort for short tables and non-terminal output; otherwise only the
+    # rows that fit on screen are selected and the rest summarised
+    rows = max(_STYLE_ROWS_THRESHOLD, shutil.get_terminal_size().lines)
+    if total_playlists > rows and sys.stdout.isatty():
+        shown = heapq.nsmallest(rows, results.items(), key=itemgetter(0))
+    else:
+        shown = sorted(results.items())
 
-    for style, result in sorted(results.items()):
+    for style, result in shown:
         success_icon = "✅" if result.success else "❌"
-        click.echo(
+        lines.append(
             f"{success_icon} {style:<27} | "
             f"{result.found_tracks:<8} | "
             f"{result.added_tracks:<8} | "
             f"{result.failed_tracks:<8}"
         )
+    if len(shown) < total_playlists:
+        lines.append(f"… {total_playlists - len(shown)} more styles")
 
-    click.echo("=" * 80)
-    click.echo(
+    lines.append(_STYLE_SEPARATOR)
+    lines.append(
         f"✅ Style-based sync completed! "
         f"Created {successful_playlists} playlists with {total_added} tracks."
     )
 
+    # One write for the whole report
+    click.echo("\n".join(lines))
+
 
 def execute_style_sync_command(
     config: Config,
     base_playlist_name: str,
     folder_id: Optional[int],
     limit: Optional[int],
+    discogs_service: Optional[DiscogsService] = None,
+    tidal_service: Optional[TidalService] = None,
 ) -> None:
     """
     Execute the style-based sync command.
 
     Creates multiple Tidal playlists based on styles/subgenres from Discogs.
     Tracks from albums with multiple styles will be added to multiple playlists.
+    Authenticated services from earlier commands can be passed in for reuse.
     """
     # Validate and sanitize playlist name
     if not base_playlist_name or not base_playlist_name.strip():
@@ -365,15 +643,22 @@ def execute_style_sync_command(
     )
 
     try:
-        # Initialize services
-        discogs_service, tidal_auth, sync_service = initialize_services(config)
-        tidal_service = TidalService(config)
+        # Services are created as the steps below first use them
+        discogs_authenticated = discogs_service is not None
+        tidal_authenticated = tidal_service is not None
+        services = initialize_services(
+            config, discogs_service, tidal_service=tidal_service
+        )
+        discogs_service = services.discogs_service
 
         # Resolve folder selection
-        resolved_folder_id = resolve_folder_selection(discogs_service, folder_id)
+        folder_cache = _FolderCache(discogs_service)
+        resolved_folder_id = resolve_folder_selection(
+            discogs_service, folder_id, folder_cache
+        )
 
         # Display sync parameters
-        display_folder_info(discogs_service, resolved_folder_id)
+        display_folder_info(discogs_service, resolved_folder_id, folder_cache)
         if limit:
             click.echo(f"🔢 Limit: {limit} tracks")
 
@@ -382,8 +667,11 @@ def execute_style_sync_command(
 
         # Authenticate services
         click.echo("🔐 Authenticating with services...")
-        discogs_service.authenticate_with_progress(auth_progress)
-        tidal_service.authenticate_with_progress(auth_progress)
+        authenticate_concurrently(
+            None if discogs_authenticated else discogs_service,
+            None if tidal_authenticated else services.tidal_service,
+            auth_progress,
+        )
 
         # Fetch tracks from Discogs
         click.echo(f"\n📀 Fetching tracks from Discogs folder {resolved_folder_id}...")
@@ -403,7 +691,9 @@ def execute_style_sync_command(
 
         # Create style-based playlists
         click.echo("\n🎨 Creating playlists by style/subgenre...")
-        results = tidal_service.create_style_based_playlists(tracks, base_playlist_name)
+        results = services.tidal_service.create_style_based_playlists(
+            tracks, base_playlist_name
+        )
 
         # Display results
         if results:
@@ -1,6 +1,7 @@
 """
 Configuration management for discogs_to_tidal.
 """
+import copy
 import json
 import logging
 import os
@@ -37,6 +38,9 @@ class Config:
     # Internal settings
     _project_root: Optional[Path] = field(default=None, init=False)
     _tokens_dir: Optional[Path] = field(default=None, init=False)
+    _env_file_present: Optional[bool] = field(default=None, init=False)
+    _discogs_token_searched: bool = field(default=False, init=False)
+    _configured_token: Optional[str] = field(default=None, init=False)
 
     def __post_init__(self) -> None:
         """Initialize derived settings."""
@@ -49,6 +53,7 @@ class Config:
         self.setup_logging()
 
         # Load tokens from storage if not already set
+        self._configured_token = self.discogs_token
         if self._tokens_dir and self._tokens_dir.exists():
             self.load_tokens_from_storage()
 
@@ -173,6 +178,13 @@ class Config:
         """Get the cache directory."""
         return self.project_root / ".cache"
 
+    @property
+    def env_file_present(self) -> bool:
+        """Whether a .env file exists in the working directory (checked once)."""
+        if self._env_file_present is None:
+            self._env_file_present = Path(".env").is_file()
+        return self._env_file_present
+
     def ensure_directories(self) -> None:
         """Ensure required directories exist."""
         self.tokens_dir.mkdir(exist_ok=True)
@@ -185,6 +197,22 @@ class Config:
             os.chmod(self.tokens_dir, stat.S_IRWXU)  # 700
             os.chmod(self.cache_dir, stat.S_IRWXU)  # 700
 
+    def copy(self) -> "Config":
+        """
+        Return a copy of these settings with per-run state reset.
+
+        Unlike building a new Config, this skips project root discovery and
+        logging setup. The token is re-read from token storage, and the
+        cached token lookup and .env check are dropped.
+        """
+        config = copy.copy(self)
+        config.discogs_token = self._configured_token
+        config._discogs_token_searched = False
+        config._env_file_present = None
+        if config._tokens_dir and config._tokens_dir.exists():
+            config.load_tokens_from_storage()
+        return config
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary (excluding private fields)."""
         return {
@@ -230,6 +258,10 @@ class Config:
         if self.discogs_token:
             return self.discogs_token
 
+        # A previous call already looked everywhere and found nothing
+        if self._discogs_token_searched:
+            return None
+
         # 2. Check environment variable
         env_token = os.getenv("DISCOGS_TOKEN")
         if env_token:
@@ -257,6 +289,7 @@ class Config:
         except Exception as e:
             logger.warning(f"Failed to load Discogs token from session storage: {e}")
 
+        self._discogs_token_searched = True
         return None
 
     def save_discogs_token(self, token: str) -> bool:
@@ -1,6 +1,7 @@
 """
 Custom exceptions for the discogs_to_tidal package.
 """
+from typing import Iterable
 
 
 class DiscogsToTidalError(Exception):
@@ -43,3 +44,17 @@ class RateLimitError(DiscogsToTidalError):
     """Raised when API rate limits are exceeded."""
 
     pass
+
+
+class InvalidFolderError(DiscogsToTidalError):
+    """Raised when a Discogs collection folder ID doesn't exist."""
+
+    def __init__(self, folder_id: int, valid_folder_ids: Iterable[int]):
+        super().__init__(folder_id)
+        self.folder_id = folder_id
+        self.valid_folder_ids = valid_folder_ids
+
+    def __str__(self) -> str:
+        # Built only when shown, so callers that just catch it skip the sort
+        available = ", ".join(f"ID {fid}" for fid in sorted(self.valid_folder_ids))
+        return f"Invalid folder ID {self.folder_id}. Available: {available}"
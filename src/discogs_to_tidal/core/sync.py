@@ -9,6 +9,7 @@ from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 from ..integrations.discogs.client import DiscogsService
 from ..integrations.tidal.auth import TidalAuth
 from ..integrations.tidal.search import TidalSearchService
+from ..integrations.tidal.search_cache import SearchCache
 from .exceptions import AuthenticationError, SyncError
 from .models import Album, SyncResult, Track
 
@@ -23,10 +24,12 @@ class SyncService:
         discogs_service: DiscogsService,
         tidal_auth: TidalAuth,
         output_dir: Optional[Path] = None,
+        search_cache: Optional[SearchCache] = None,
     ):
         self.discogs_service = discogs_service
         self.tidal_auth = tidal_auth
         self.output_dir = output_dir or Path.cwd() / "output"
+        self.search_cache = search_cache
         self.search_service: Optional[TidalSearchService] = None
         self._playlist_storage_file = self.output_dir / "tidal_playlists.json"
 
@@ -35,6 +38,7 @@ class SyncService:
         progress_callback: Optional[Callable[[str], None]] = None,
         playlist_name: str = "Discogs Collection",
         folder_id: int = 0,
+        preloaded_albums: Optional[List[Tuple[Album, List[Track]]]] = None,
     ) -> SyncResult:
         """
         Synchronize Discogs collection to Tidal using album-based optimization.
@@ -43,6 +47,8 @@ class SyncService:
             progress_callback: Optional callback for progress updates
             playlist_name: Name for the Tidal playlist
             folder_id: Discogs collection folder ID (0 = default "All" folder)
+            preloaded_albums: Albums already fetched with prefetch_discogs();
+                skips the Discogs fetch when given
 
         Returns:
             SyncResult with sync statistics
@@ -52,9 +58,12 @@ class SyncService:
             session = self._initialize_tidal_session(progress_callback)
 
             # Fetch albums from Discogs
-            albums_with_tracks = self._fetch_discogs_albums(
-                folder_id, progress_callback
-            )
+            if preloaded_albums is not None:
+                albums_with_tracks = preloaded_albums
+            else:
+                albums_with_tracks = self._fetch_discogs_albums(
+                    folder_id, progress_callback
+                )
 
             if not albums_with_tracks:
                 return self._create_empty_sync_result(playlist_name)
@@ -90,6 +99,24 @@ class SyncService:
                 errors=[str(e)],
             )
 
+    def prefetch_discogs(
+        self, folder_id: int, progress_callback: Optional[Callable[[str], None]] = None
+    ) -> List[Tuple[Album, List[Track]]]:
+        """
+        Fetch the Discogs side of a sync ahead of sync_collection().
+
+        Lets callers overlap the Discogs fetch with Tidal authentication and
+        pass the result back in as preloaded_albums.
+
+        Args:
+            folder_id: Discogs collection folder ID (0 = default "All" folder)
+            progress_callback: Optional callback for progress updates
+
+        Returns:
+            List of (album, tracks) tuples
+        """
+        return self._fetch_discogs_albums(folder_id, progress_callback)
+
     def _initialize_tidal_session(
         self, progress_callback: Optional[Callable[[str], None]] = None
     ) -> Any:
@@ -101,7 +128,7 @@ class SyncService:
         if not session:
             raise AuthenticationError("Failed to authenticate with Tidal")
 
-        self.search_service = TidalSearchService(session)
+        self.search_service = TidalSearchService(session, self.search_cache)
         return session
 
     def _fetch_discogs_albums(
@@ -11,10 +11,12 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional
 
+import requests
 from discogs_client import Client as DiscogsClient  # type: ignore[import-untyped]
 
 from ...core.config import Config
 from ...core.exceptions import AuthenticationError
+from .http_cache import SessionTokenFetcher
 
 logger = logging.getLogger(__name__)
 
@@ -39,8 +41,9 @@ class DiscogsAuthStatus(Enum):
 class DiscogsAuth:
     """Handle Discogs authentication and session management."""
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, http_session: Optional[requests.Session] = None):
         self.config = config
+        self.http_session = http_session
         self._client: Optional[DiscogsClient] = None
         self._user: Any = None  # User object from discogs_client
         self.auth_timeout = 30  # 30 seconds for token validation
@@ -70,6 +73,14 @@ class DiscogsAuth:
         if self.progress_callback:
             self.progress_callback(message, progress)
 
+    def _create_client(self, token: str) -> DiscogsClient:
+        """Create a Discogs client for a personal token."""
+        client = DiscogsClient("DiscogsToTidalApp/1.0", user_token=token)
+        if self.http_session is not None:
+            # Route requests through the shared (possibly cached) session
+            client._fetcher = SessionTokenFetcher(self.http_session, token)
+        return client
+
     def get_token_storage_path(self) -> Path:
         """Get secure token storage path within the project directory."""
         tokens_dir = self.config.tokens_dir
@@ -165,7 +176,7 @@ class DiscogsAuth:
             self._notify_progress("Validating stored Discogs token...", 20)
 
             # Test the stored token
-            client = DiscogsClient("DiscogsToTidalApp/1.0", user_token=token)
+            client = self._create_client(token)
 
             # Try to get user identity to validate token
             user = client.identity()
@@ -235,9 +246,7 @@ class DiscogsAuth:
             token_preview = self.config.discogs_token[:6] + "..."
             logger.info(f"Authenticating with Discogs token: {token_preview}")
 
-            client = DiscogsClient(
-                "DiscogsToTidalApp/1.0", user_token=self.config.discogs_token
-            )
+            client = self._create_client(self.config.discogs_token)
 
             self._notify_progress("Validating Discogs credentials...", 70)
 
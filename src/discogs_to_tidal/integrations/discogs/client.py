@@ -1,38 +1,55 @@
 """
 Discogs API client for fetching collection data.
 """
-import json
+import copy
 import logging
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, cast
 
 from discogs_client import Client as DiscogsClient  # type: ignore[import-untyped]
 
 from ...core.config import Config
 from ...core.exceptions import AuthenticationError, SearchError
 from ...core.models import Album, Artist, Track
+from ...utils.json_utils import dump_json, dump_json_stream, load_json
+from ...utils.rate_limit import RateLimiter
 from .auth import DiscogsAuth, DiscogsAuthStatus
+from .http_cache import create_discogs_session
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class DiscogsService:
     """Service for interacting with the Discogs API with improved authentication."""
 
     def __init__(self, config: Config):
         self.config = config
-        self._auth = DiscogsAuth(config)
+        self._http_session = create_discogs_session(
+            config.cache_dir if config.cache_tracks else None,
+            config.cache_expiry_hours,
+        )
+        self._auth = DiscogsAuth(config, self._http_session)
         self._client: Optional[DiscogsClient] = None
         self._user: Any = None  # Discogs user object
         self._cache_file = Path("output") / "discogs_cache.json"
 
+        # Fetch configuration (Discogs allows 60 authenticated requests/minute)
+        self.max_fetch_workers = 4
+        self._rate_limiter = RateLimiter(calls=55, period=60.0)
+        self._fetch_cancelled = threading.Event()
+
     @property
     def client(self) -> DiscogsClient:
         """Get authenticated Discogs client."""
         if self._client is None:
             self._client = self._auth.authenticate()
+            self._adopt_token()
         return self._client
 
     @property
@@ -47,11 +64,52 @@ class DiscogsService:
         try:
             self._client = self._auth.authenticate()
             self._user = self._auth.user
+            self._adopt_token()
             if self._user is not None and hasattr(self._user, "username"):
                 logger.info(f"Authenticated as Discogs user: {self._user.username}")
         except Exception as e:
             raise AuthenticationError(f"Discogs authentication failed: {e}")
 
+    def set_token(self, token: str) -> None:
+        """
+        Switch to a different personal access token.
+
+        Drops the current client and user; the next authenticate() call
+        validates the new token. The token is tried on a copy of the config
+        and only written to the shared config once it has been accepted.
+
+        Args:
+            token: Discogs personal access token
+        """
+        auth_config = copy.copy(self.config)
+        auth_config.discogs_token = token
+        self._auth = DiscogsAuth(auth_config, self._http_session)
+        self._client = None
+        self._user = None
+
+    def cancel_collection_fetch(self) -> None:
+        """
+        Stop a get_collection_albums() call running on another thread.
+
+        Releases not yet requested are skipped and the fetch returns what it
+        has so far. Meant for abandoning a background prefetch; stays in
+        effect until reset_collection_fetch().
+        """
+        self._fetch_cancelled.set()
+
+    def reset_collection_fetch(self) -> None:
+        """
+        Clear an earlier cancel_collection_fetch().
+
+        Call this before starting a fetch that may later be cancelled, on the
+        thread that will cancel it, so an early cancel can't be lost.
+        """
+        self._fetch_cancelled.clear()
+
+    def _adopt_token(self) -> None:
+        """Copy a token that just authenticated into the shared config."""
+        self.config.discogs_token = self._auth.config.discogs_token
+
     def authenticate_with_progress(
         self, progress_callback: Callable[[str, int], None]
     ) -> bool:
@@ -68,6 +126,7 @@ class DiscogsService:
             self._auth.set_progress_callback(progress_callback)
             self._client = self._auth.authenticate()
             self._user = self._auth.user
+            self._adopt_token()
             return True
         except Exception as e:
             logger.error(f"Discogs authentication failed: {e}")
@@ -135,30 +194,44 @@ class DiscogsService:
 
             logger.info(f"Found {len(releases)} releases in collection")
 
-            for i, release in enumerate(releases, 1):
-                if self.config.max_tracks > 0 and len(tracks) >= self.config.max_tracks:
-                    logger.info(f"Reached max_tracks limit ({self.config.max_tracks})")
-                    break
+            with ThreadPoolExecutor(max_workers=self.max_fetch_workers) as executor:
+                futures = [
+                    executor.submit(
+                        self._rate_limited,
+                        self._process_release,
+                        release.release,
+                        i,
+                        len(releases),
+                    )
+                    for i, release in enumerate(releases, 1)
+                ]
 
-                try:
-                    # Show real-time progress for each release
-                    if progress_callback:
-                        release_title = release.release.title
-                        progress_callback(
-                            f"Fetching release {i}/{len(releases)}: {release_title}"
+                for i, (release, future) in enumerate(zip(releases, futures), 1):
+                    if (
+                        self.config.max_tracks > 0
+                        and len(tracks) >= self.config.max_tracks
+                    ):
+                        logger.info(
+                            f"Reached max_tracks limit ({self.config.max_tracks})"
                         )
+                        for pending in futures[i - 1 :]:
+                            pending.cancel()
+                        break
 
-                    release_tracks = self._process_release(
-                        release.release, i, len(releases)
-                    )
-                    tracks.extend(release_tracks)
+                    try:
+                        # Show real-time progress for each release
+                        if progress_callback:
+                            release_title = release.release.title
+                            progress_callback(
+                                f"Fetching release {i}/{len(releases)}: "
+                                f"{release_title}"
+                            )
 
-                    # Rate limiting - increase delay after errors
-                    time.sleep(0.5)
+                        tracks.extend(future.result())
 
-                except Exception as e:
-                    logger.warning(f"Failed to process release {i}: {e}")
-                    continue
+                    except Exception as e:
+                        logger.warning(f"Failed to process release {i}: {e}")
+                        continue
 
             logger.info(f"Total tracks fetched: {len(tracks)}")
 
@@ -225,49 +298,78 @@ class DiscogsService:
 
             logger.info(f"Found {len(releases)} releases in collection")
 
-            for i, release in enumerate(releases, 1):
-                try:
-                    # Show real-time progress for each release
-                    if progress_callback:
-                        release_title = release.release.title
-                        progress_callback(
-                            f"Fetching release {i}/{len(releases)}: {release_title}"
+            with ThreadPoolExecutor(max_workers=self.max_fetch_workers) as executor:
+                # Fetch uncached releases in the background
+                futures: Dict[int, "Future[Tuple[Optional[Album], List[Track]]]"]
+                futures = {}
+                for i, release in enumerate(releases, 1):
+                    if not self._is_release_cached(release.release.id, cache):
+                        futures[i] = executor.submit(
+                            self._rate_limited,
+                            self._process_release_to_album,
+                            release.release,
+                            i,
+                            len(releases),
                         )
 
-                    # Check if release is cached
-                    release_id = release.release.id
-                    if self._is_release_cached(release_id, cache):
-                        cached_result = self._get_cached_release(release_id, cache)
-                        if cached_result:
-                            album, tracks = cached_result
-                            albums_with_tracks.append((album, tracks))
-                            cache_hits += 1
-                            logger.debug(
-                                f"Cache hit for release {release_id}: {album.title}"
+                for i, release in enumerate(releases, 1):
+                    if self._fetch_cancelled.is_set():
+                        logger.info("Collection fetch cancelled")
+                        for pending in futures.values():
+                            pending.cancel()
+                        break
+
+                    try:
+                        # Show real-time progress for each release
+                        if progress_callback:
+                            release_title = release.release.title
+                            progress_callback(
+                                f"Fetching release {i}/{len(releases)}: "
+                                f"{release_title}"
                             )
-                            continue
 
-                    # Process release if not cached
-                    result = self._process_release_to_album(
-                        release.release, i, len(releases)
-                    )
-                    if result[0] is not None and result[1]:
-                        album, tracks = result[0], result[1]
-                        albums_with_tracks.append((album, tracks))
-                        # Cache the processed release
-                        self._cache_release(release_id, album, tracks, cache)
-                        cache_misses += 1
+                        # Check if release is cached
+                        release_id = release.release.id
+                        if i not in futures:
+                            cached_result = self._get_cached_release(release_id, cache)
+                            if cached_result:
+                                album, tracks = cached_result
+                                albums_with_tracks.append((album, tracks))
+                                cache_hits += 1
+                                logger.debug(
+                                    f"Cache hit for release {release_id}: "
+                                    f"{album.title}"
+                                )
+                                continue
+
+                            # Unreadable cache entry, fetch it now
+                            result = self._rate_limited(
+                                self._process_release_to_album,
+                                release.release,
+                                i,
+                                len(releases),
+                            )
+                        else:
+                            result = futures[i].result()
 
-                    # Rate limiting - increase delay after errors
-                    time.sleep(0.5)
+                        if result[0] is not None and result[1]:
+                            album, tracks = result[0], result[1]
+                            albums_with_tracks.append((album, tracks))
+                            # Cache the processed release
+                            self._cache_release(release_id, album, tracks, cache)
+                            cache_misses += 1
 
-                except Exception as e:
-                    logger.warning(f"Failed to process release {i}: {e}")
-                    continue
+                    except Exception as e:
+                        logger.warning(f"Failed to process release {i}: {e}")
+                        continue
 
             # Save updated cache
             self._save_cache(cache)
 
+            # A partial fetch shouldn't replace the saved albums metadata
+            if self._fetch_cancelled.is_set():
+                return albums_with_tracks
+
             logger.info(f"Total albums fetched: {len(albums_with_tracks)}")
             logger.info(f"Cache performance: {cache_hits} hits, {cache_misses} misses")
 
@@ -279,6 +381,27 @@ class DiscogsService:
         except Exception as e:
             raise SearchError(f"Failed to fetch collection: {e}")
 
+    def _rate_limited(self, func: Callable[..., T], *args: Any) -> T:
+        """Call func once the Discogs rate limiter allows another request."""
+        self._rate_limiter.acquire()
+        try:
+            return func(*args)
+        finally:
+            self._sync_rate_limit()
+
+    def _sync_rate_limit(self) -> None:
+        """Feed the last X-Discogs-Ratelimit-Remaining value to the limiter."""
+        fetcher = getattr(self._client, "_fetcher", None)
+        remaining = getattr(fetcher, "rate_limit_remaining", None)
+        if remaining is None:
+            return
+
+        try:
+            # Leave room for requests other workers already have in flight
+            self._rate_limiter.update_remaining(int(remaining) - self.max_fetch_workers)
+        except (TypeError, ValueError):
+            pass
+
     def get_collection_folders(self) -> List[Dict[str, Any]]:
         """
         Get all collection folders for the authenticated user.
@@ -320,9 +443,8 @@ class DiscogsService:
             return {}
 
         try:
-            with open(self._cache_file, "r", encoding="utf-8") as f:
-                cache_data = json.load(f)
-                return cast(Dict[str, Any], cache_data)
+            cache_data = load_json(self._cache_file)
+            return cast(Dict[str, Any], cache_data)
         except Exception as e:
             logger.warning(f"Failed to load cache: {e}")
             return {}
@@ -333,8 +455,8 @@ class DiscogsService:
             # Ensure output directory exists
             self._cache_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(self._cache_file, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f, indent=2, ensure_ascii=False)
+            # Machine-read only, so skip indentation to keep the file small
+            dump_json(cache_data, self._cache_file, indent=False)
             logger.debug(
                 f"Cache saved with {len(cache_data.get('releases', {}))} releases"
             )
@@ -682,60 +804,56 @@ class DiscogsService:
             output_dir = Path("output")
             output_dir.mkdir(parents=True, exist_ok=True)
 
-            # Prepare metadata
-            metadata: Dict[str, Any] = {
-                "export_info": {
-                    "timestamp": datetime.now().isoformat(),
-                    "discogs_to_tidal_version": "0.2.0",
-                    "folder_id": folder_id,
-                    "total_tracks": len(tracks),
-                },
-                "tracks": [],
+            export_info = {
+                "timestamp": datetime.now().isoformat(),
+                "discogs_to_tidal_version": "0.2.0",
+                "folder_id": folder_id,
+                "total_tracks": len(tracks),
             }
 
-            # Convert tracks to dictionaries
-            for track in tracks:
-                track_data = {
-                    "discogs_info": {
-                        "id": track.id,
-                        "title": track.title,
-                        "track_number": track.track_number,
-                        "duration_seconds": track.duration,
-                        "duration_formatted": track.duration_formatted,
-                    },
-                    "artists": [
-                        {"id": artist.id, "name": artist.name}
-                        for artist in track.artists
-                    ],
-                    "primary_artist": {
-                        "id": track.primary_artist.id if track.primary_artist else None,
-                        "name": track.primary_artist.name
-                        if track.primary_artist
-                        else None,
-                    }
-                    if track.primary_artist
-                    else None,
-                    "album": {
-                        "title": track.album.title if track.album else None,
-                        "year": track.album.year if track.album else None,
-                        "genres": track.album.genres if track.album else [],
-                        "styles": track.album.styles if track.album else [],
-                    },
-                }
-                metadata["tracks"].append(track_data)
-
-            # Save to file
+            # Save to file, converting one track at a time
             filename = f"discogs_tracks_folder_{folder_id}.json"
             filepath = output_dir / filename
 
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            dump_json_stream(
+                {"export_info": export_info},
+                "tracks",
+                (self._track_to_export_dict(track) for track in tracks),
+                filepath,
+            )
 
             logger.info(f"✓ Tracks metadata saved to {filepath}")
 
         except Exception as e:
             logger.warning(f"Failed to save tracks metadata: {e}")
 
+    def _track_to_export_dict(self, track: Track) -> Dict[str, Any]:
+        """Convert a track to its metadata export representation."""
+        return {
+            "discogs_info": {
+                "id": track.id,
+                "title": track.title,
+                "track_number": track.track_number,
+                "duration_seconds": track.duration,
+                "duration_formatted": track.duration_formatted,
+            },
+            "artists": [
+                {"id": artist.id, "name": artist.name} for artist in track.artists
+            ],
+            "primary_artist": {
+                "id": track.primary_artist.id if track.primary_artist else None,
+                "name": track.primary_artist.name if track.primary_artist else None,
+            }
+            if track.primary_artist
+            else None,
+            "album": {
+                "title": track.album.title if track.album else None,
+                "year": track.album.year if track.album else None,
+                "genres": track.album.genres if track.album else [],
+                "styles": track.album.styles if track.album else [],
+            },
+        }
+
     def _save_albums_to_json(
         self, albums_with_tracks: List[Tuple[Album, List[Track]]], folder_id: int
     ) -> None:
@@ -745,64 +863,65 @@ class DiscogsService:
             output_dir = Path("output")
             output_dir.mkdir(parents=True, exist_ok=True)
 
-            # Prepare metadata
-            metadata: Dict[str, Any] = {
-                "export_info": {
-                    "timestamp": datetime.now().isoformat(),
-                    "discogs_to_tidal_version": "0.2.0",
-                    "folder_id": folder_id,
-                    "total_albums": len(albums_with_tracks),
-                },
-                "albums": [],
+            export_info = {
+                "timestamp": datetime.now().isoformat(),
+                "discogs_to_tidal_version": "0.2.0",
+                "folder_id": folder_id,
+                "total_albums": len(albums_with_tracks),
             }
 
-            # Convert albums to dictionaries
-            for album, tracks in albums_with_tracks:
-                album_data = {
-                    "discogs_info": {
-                        "id": album.id,
-                        "title": album.title,
-                        "year": album.year,
-                        "genres": album.genres,
-                        "styles": album.styles,
-                    },
-                    "artists": [
-                        {"id": artist.id, "name": artist.name}
-                        for artist in album.artists
-                    ],
-                    "primary_artist": {
-                        "id": album.primary_artist.id if album.primary_artist else None,
-                        "name": (
-                            album.primary_artist.name if album.primary_artist else None
-                        ),
-                    }
-                    if album.primary_artist
-                    else None,
-                    "tracks": [
-                        {
-                            "title": track.title,
-                            "track_number": track.track_number,
-                            "duration_seconds": track.duration,
-                            "duration_formatted": track.duration_formatted,
-                            "artists": [
-                                {"id": artist.id, "name": artist.name}
-                                for artist in track.artists
-                            ],
-                        }
-                        for track in tracks
-                    ],
-                    "track_count": len(tracks),
-                }
-                metadata["albums"].append(album_data)
-
-            # Save to file
+            # Save to file, converting one album at a time
             filename = f"discogs_albums_folder_{folder_id}.json"
             filepath = output_dir / filename
 
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            dump_json_stream(
+                {"export_info": export_info},
+                "albums",
+                (
+                    self._album_to_export_dict(album, tracks)
+                    for album, tracks in albums_with_tracks
+                ),
+                filepath,
+            )
 
             logger.info(f"✓ Albums metadata saved to {filepath}")
 
         except Exception as e:
             logger.warning(f"Failed to save albums metadata: {e}")
+
+    def _album_to_export_dict(
+        self, album: Album, tracks: List[Track]
+    ) -> Dict[str, Any]:
+        """Convert an album and its tracks to their metadata export representation."""
+        return {
+            "discogs_info": {
+                "id": album.id,
+                "title": album.title,
+                "year": album.year,
+                "genres": album.genres,
+                "styles": album.styles,
+            },
+            "artists": [
+                {"id": artist.id, "name": artist.name} for artist in album.artists
+            ],
+            "primary_artist": {
+                "id": album.primary_artist.id if album.primary_artist else None,
+                "name": album.primary_artist.name if album.primary_artist else None,
+            }
+            if album.primary_artist
+            else None,
+            "tracks": [
+                {
+                    "title": track.title,
+                    "track_number": track.track_number,
+                    "duration_seconds": track.duration,
+                    "duration_formatted": track.duration_formatted,
+                    "artists": [
+                        {"id": artist.id, "name": artist.name}
+                        for artist in track.artists
+                    ],
+                }
+                for track in tracks
+            ],
+            "track_count": len(tracks),
+        }
@@ -0,0 +1,99 @@
+"""
+HTTP session and response caching for the Discogs API.
+"""
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from discogs_client.fetchers import Fetcher  # type: ignore[import-untyped]
+
+logger = logging.getLogger(__name__)
+
+
+def create_discogs_session(
+    cache_dir: Optional[Path] = None, expire_hours: int = 24
+) -> requests.Session:
+    """
+    Create the HTTP session used for Discogs API requests.
+
+    With a cache directory and requests-cache installed, responses are cached
+    on disk: release data for ``expire_hours``, while collection listings are
+    revalidated on every request (conditional GETs answered with 304 when
+    unchanged). The cache lives on this session only, so other clients in the
+    process (e.g. tidalapi) are unaffected. Otherwise a plain session is
+    returned, which still keeps connections to the API alive.
+
+    Args:
+        cache_dir: Directory for the SQLite cache database, or None for no cache
+        expire_hours: How long release responses stay fresh
+
+    Returns:
+        A requests session, cached when possible
+    """
+    if cache_dir is None:
+        return requests.Session()
+
+    try:
+        import requests_cache
+    except ImportError:
+        logger.debug("requests-cache not installed, Discogs HTTP cache disabled")
+        return requests.Session()
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        session: requests.Session = requests_cache.CachedSession(
+            str(cache_dir / "discogs_http_cache"),
+            backend="sqlite",
+            cache_control=True,
+            urls_expire_after={
+                "api.discogs.com/releases": expire_hours * 3600,
+                "api.discogs.com/users": requests_cache.EXPIRE_IMMEDIATELY,
+                "*": requests_cache.DO_NOT_CACHE,
+            },
+        )
+    except Exception as e:
+        logger.warning(f"Failed to enable Discogs HTTP cache: {e}")
+        return requests.Session()
+
+    logger.debug(f"Discogs HTTP cache enabled in {cache_dir}")
+    return session
+
+
+class SessionTokenFetcher(Fetcher):
+    """
+    discogs_client fetcher sending user-token requests through a session.
+
+    The stock fetchers call ``requests.request`` directly, so they can neither
+    reuse connections nor use a cached session. The last
+    X-Discogs-Ratelimit-Remaining header is kept in ``rate_limit_remaining``,
+    as python3-discogs-client's fetchers do.
+    """
+
+    def __init__(self, session: requests.Session, user_token: str):
+        self.session = session
+        self.user_token = user_token
+        self.rate_limit_remaining: Optional[str] = None
+
+    def fetch(
+        self,
+        client: Any,
+        method: str,
+        url: str,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        json: bool = True,
+    ) -> Tuple[bytes, int]:
+        response = self.session.request(
+            method,
+            url,
+            params={"token": self.user_token},
+            data=data,
+            headers=headers,
+        )
+        # Cached responses carry the budget from when they were stored
+        if not getattr(response, "from_cache", False):
+            remaining = response.headers.get("X-Discogs-Ratelimit-Remaining")
+            if remaining is not None:
+                self.rate_limit_remaining = remaining
+        return response.content, response.status_code
@@ -4,5 +4,6 @@ Tidal integration package.
 from .auth import TidalAuth
 from .client import TidalService
 from .search import TidalSearchService
+from .search_cache import SearchCache
 
-__all__ = ["TidalAuth", "TidalService", "TidalSearchService"]
+__all__ = ["TidalAuth", "TidalService", "TidalSearchService", "SearchCache"]
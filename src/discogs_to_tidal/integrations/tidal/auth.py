@@ -21,6 +21,7 @@ import tidalapi
 
 from ...core.config import Config
 from ...core.exceptions import AuthenticationError
+from ...utils.http_utils import configure_connection_pool
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +67,12 @@ class TidalAuth:
     def _create_session(self) -> tidalapi.Session:
         """Create a basic Tidal session."""
         session = tidalapi.Session()
+
+        # Reuse keep-alive connections across the many search requests
+        request_session = getattr(session, "request_session", None)
+        if request_session is not None:
+            configure_connection_pool(request_session)
+
         logger.debug("Created Tidal session")
         return session
 
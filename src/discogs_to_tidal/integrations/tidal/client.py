@@ -2,15 +2,18 @@
 Tidal API client for playlist management.
 """
 import logging
-from typing import Any, Callable, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 import tidalapi
 
 from ...core.config import Config
 from ...core.exceptions import SyncError
 from ...core.models import SyncResult, Track
+from ...utils.string_utils import normalize_string
 from .auth import TidalAuth
 from .search import TidalSearchService
+from .search_cache import SearchCache
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +26,11 @@ class TidalService:
         self._auth = TidalAuth(config)
         self._search_service: Optional[TidalSearchService] = None
         self._session: Optional[tidalapi.Session] = None
+        self._playlists_by_name: Optional[Dict[str, Any]] = None
+
+        # Search configuration
+        self.max_search_workers = 8  # Concurrent Tidal searches in flight
+        self.playlist_add_batch_size = 100  # Track IDs per playlist.add call
 
     @property
     def session(self) -> tidalapi.Session:
@@ -31,6 +39,11 @@ class TidalService:
             self._session = self._auth.authenticate()
         return self._session
 
+    @property
+    def auth(self) -> TidalAuth:
+        """Get the authenticator holding this service's Tidal session."""
+        return self._auth
+
     def authenticate_with_progress(
         self, progress_callback: Optional[Callable] = None
     ) -> tidalapi.Session:
@@ -76,13 +89,19 @@ class TidalService:
     def logout(self) -> bool:
         """Clear authentication and saved tokens."""
         self._session = None
+        self._playlists_by_name = None
         return self._auth.clear_session()
 
     @property
     def search_service(self) -> TidalSearchService:
         """Get search service instance."""
         if self._search_service is None:
-            self._search_service = TidalSearchService(self.session)
+            search_cache = (
+                SearchCache.from_config(self.config)
+                if self.config.cache_tracks
+                else None
+            )
+            self._search_service = TidalSearchService(self.session, search_cache)
         return self._search_service
 
     @search_service.setter
@@ -103,29 +122,9 @@ class TidalService:
         Returns:
             Tidal playlist object
         """
-        logger.info("Fetching your Tidal playlists...")
-
-        try:
-            playlists = self.session.user.playlists()  # type: ignore[union-attr]
-        except Exception as e:
-            logger.error(f"Error fetching playlists: {e}")
-            playlists = []
-
-        # Look for existing playlist
-        for playlist in playlists:
-            if hasattr(playlist, "name") and playlist.name == name:
-                logger.info(f"Found existing playlist: {name}")
-                return playlist  # type: ignore[no-any-return]
-
-        # Create new playlist
-        logger.info(f"Creating new playlist: {name}")
-        try:
-            playlist = self.session.user.create_playlist(  # type: ignore[union-attr]
-                name, description
-            )
-            return playlist  # type: ignore[no-any-return]
-        except Exception as e:
-            raise SyncError(f"Failed to create playlist '{name}': {e}")
+        return self._create_or_get_cached_playlist(  # type: ignore[no-any-return]
+            name, self._get_playlists_by_name(), description
+        )
 
     def add_tracks_to_playlist(
         self, playlist_name: str, tracks: List[Track]
@@ -156,9 +155,9 @@ class TidalService:
 
         logger.info(f"Adding {len(tracks)} tracks to playlist '{playlist_name}'...")
 
-        added_count = 0
         failed_count = 0
         found_tracks = []
+        searchable_tracks = []
 
         for idx, track in enumerate(tracks, 1):
             if not track.title or not track.primary_artist:
@@ -167,31 +166,74 @@ class TidalService:
                 )
                 failed_count += 1
                 continue
+            searchable_tracks.append(track)
+
+        # Tracks already in the playlist need neither a search nor an add
+        existing_ids, existing_keys = self._get_playlist_contents(playlist)
+        tracks_to_search = [
+            track
+            for track in searchable_tracks
+            if self._get_search_key(track) not in existing_keys
+        ]
+        already_present = len(searchable_tracks) - len(tracks_to_search)
+        if already_present:
+            logger.info(f"Skipping {already_present} tracks already in the playlist")
 
+        added_count = 0
+        pending_tidal_tracks: List[Any] = []
+        queued_ids = set(existing_ids)
+
+        # Tracks sharing a normalized title and artist are only searched once
+        unique_tracks = self._unique_tracks(tracks_to_search)
+        search_results = zip(unique_tracks, self._iter_found_tracks(unique_tracks))
+        results_by_key: Dict[Tuple[str, str], Optional[Any]] = {}
+
+        # Search concurrently and consume results in order, flushing full
+        # batches to the playlist while the remaining searches are in flight
+        for idx, track in enumerate(searchable_tracks, 1):
+            artist_name = track.primary_artist.name if track.primary_artist else ""
             logger.info(
-                f"Track {idx}/{len(tracks)}: {track.title} "
-                f"by {track.primary_artist.name}"
+                f"Track {idx}/{len(searchable_tracks)}: {track.title} by {artist_name}"
             )
 
-            # Search for track on Tidal
-            tidal_track = self.search_service.find_track(track)
+            search_key = self._get_search_key(track)
+            if search_key in existing_keys:
+                found_tracks.append(track)
+                continue
 
-            if tidal_track:
-                try:
-                    playlist.add([tidal_track.id])  # type: ignore[attr-defined]
-                    added_count += 1
-                    found_tracks.append(track)
-                    logger.info(
-                        f"    Added: {track.title} by {track.primary_artist.name}"
-                    )
-                except Exception as e:
-                    logger.error(f"    Failed to add track to playlist: {e}")
-                    failed_count += 1
-            else:
+            if search_key not in results_by_key:
+                # First occurrence, so it is the next unique track searched
+                _, results_by_key[search_key] = next(search_results)
+            tidal_track = results_by_key[search_key]
+
+            if not tidal_track:
                 failed_count += 1
+                continue
+
+            found_tracks.append(track)
+            if tidal_track.id in queued_ids:
+                logger.debug(f"    Duplicate of an earlier track: {track.title}")
+                continue
+            queued_ids.add(tidal_track.id)
+            pending_tidal_tracks.append(tidal_track)
+
+            if len(pending_tidal_tracks) >= self.playlist_add_batch_size:
+                batch_added, batch_failed = self._add_tidal_tracks_in_batches(
+                    playlist, pending_tidal_tracks
+                )
+                added_count += batch_added
+                failed_count += batch_failed
+                pending_tidal_tracks = []
+
+        # Add whatever is left over
+        batch_added, batch_failed = self._add_tidal_tracks_in_batches(
+            playlist, pending_tidal_tracks
+        )
+        added_count += batch_added
+        failed_count += batch_failed
 
         result = SyncResult(
-            success=added_count > 0,
+            success=added_count > 0 or already_present > 0,
             total_tracks=len(tracks),
             matched_tracks=len(found_tracks),
             failed_tracks=failed_count,
@@ -230,18 +272,12 @@ class TidalService:
             return {}
 
         # Cache existing playlists to avoid repeated API calls
-        logger.info("📋 Fetching existing Tidal playlists...")
-        existing_playlists = self._get_all_playlists()
-        playlist_cache: Dict[str, Any] = {
-            playlist.name: playlist
-            for playlist in existing_playlists
-            if hasattr(playlist, "name")
-        }
-        logger.info(f"Found {len(playlist_cache)} existing playlists")
+        playlist_cache = self._get_playlists_by_name()
 
         # First pass: search for all tracks on Tidal and cache results
         logger.info(f"🔍 Searching for {len(tracks)} tracks on Tidal...")
         track_cache: Dict[str, Optional[Any]] = {}  # Track ID -> Tidal track object
+        searchable_tracks = []
 
         for i, track in enumerate(tracks, 1):
             if not track.title or not track.primary_artist:
@@ -255,10 +291,21 @@ class TidalService:
                 f"Searching track {i}/{len(tracks)}: {track.title} "
                 f"by {track.primary_artist.name}"
             )
-
-            # Search for track on Tidal only once
-            tidal_track = self.search_service.find_track(track)
-            track_cache[self._get_track_key(track)] = tidal_track
+            searchable_tracks.append(track)
+
+        # Search for each distinct title/artist on Tidal only once, several
+        # at a time
+        unique_tracks = self._unique_tracks(searchable_tracks)
+        results_by_key = dict(
+            zip(
+                [self._get_search_key(track) for track in unique_tracks],
+                self._find_tracks(unique_tracks),
+            )
+        )
+        for track in searchable_tracks:
+            track_cache[self._get_track_key(track)] = results_by_key[
+                self._get_search_key(track)
+            ]
 
         # Count successful searches
         found_tracks = sum(1 for t in track_cache.values() if t is not None)
@@ -353,6 +400,141 @@ class TidalService:
 
         return results
 
+    def _find_tracks(self, tracks: List[Track]) -> List[Optional[Any]]:
+        """
+        Search Tidal for several tracks concurrently.
+
+        Args:
+            tracks: Tracks to search for
+
+        Returns:
+            Tidal track (or None) for each input track, in the same order
+        """
+        return list(self._iter_found_tracks(tracks))
+
+    def _iter_found_tracks(self, tracks: List[Track]) -> Iterator[Optional[Any]]:
+        """
+        Search Tidal for several tracks concurrently, yielding results in order.
+
+        Each search is dominated by HTTP round-trips, so searches are dispatched
+        to a bounded thread pool instead of running one after another. The pool
+        size caps the number of requests in flight to stay clear of Tidal's
+        rate limits. Results are yielded as soon as they are available, so
+        callers can act on early results while later searches are running.
+
+        Args:
+            tracks: Tracks to search for
+
+        Yields:
+            Tidal track (or None) for each input track, in the same order
+        """
+        if not tracks:
+            return
+
+        find_track = self.search_service.find_track
+        max_workers = max(1, min(self.max_search_workers, len(tracks)))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            yield from executor.map(find_track, tracks)
+
+    def _add_tidal_tracks_in_batches(
+        self, playlist: Any, tidal_tracks: List[Any]
+    ) -> Tuple[int, int]:
+        """
+        Add Tidal tracks to a playlist in chunks of track IDs.
+
+        The playlist endpoint accepts a list of IDs, so tracks are sent in
+        batches of ``playlist_add_batch_size`` rather than one request per
+        track. If a batch is rejected, its tracks are retried one by one so a
+        single bad ID does not drop the whole chunk.
+
+        Args:
+            playlist: Tidal playlist object
+            tidal_tracks: Tidal track objects to add
+
+        Returns:
+            Tuple of (added_count, failed_count)
+        """
+        added_count = 0
+        failed_count = 0
+        batch_size = max(1, self.playlist_add_batch_size)
+
+        for start in range(0, len(tidal_tracks), batch_size):
+            batch = tidal_tracks[start : start + batch_size]
+            try:
+                playlist.add([tidal_track.id for tidal_track in batch])
+                added_count += len(batch)
+                logger.info(f"    ✅ Added {len(batch)} tracks to playlist in batch")
+            except Exception as e:
+                # Fallback to individual track addition if batch fails
+                logger.warning(f"Batch add failed, trying individual adds: {e}")
+
+                for i, tidal_track in enumerate(batch, start + 1):
+                    try:
+                        playlist.add([tidal_track.id])
+                        added_count += 1
+                        logger.debug(f"    ✅ Added track {i}/{len(tidal_tracks)}")
+                    except Exception as track_error:
+                        logger.error(f"    ❌ Failed to add track {i}: {track_error}")
+                        failed_count += 1
+
+        return added_count, failed_count
+
+    def _get_playlist_contents(
+        self, playlist: Any
+    ) -> Tuple[Set[Any], Set[Tuple[str, str]]]:
+        """
+        Get the tracks already in a playlist.
+
+        Args:
+            playlist: Tidal playlist object
+
+        Returns:
+            Tuple of (track IDs, normalized (title, artist) keys)
+        """
+        existing_ids: Set[Any] = set()
+        existing_keys: Set[Tuple[str, str]] = set()
+
+        try:
+            for tidal_track in playlist.tracks():
+                existing_ids.add(tidal_track.id)
+                artist_name = tidal_track.artist.name if tidal_track.artist else ""
+                existing_keys.add(
+                    (
+                        normalize_string(tidal_track.name or ""),
+                        normalize_string(artist_name or ""),
+                    )
+                )
+        except Exception as e:
+            logger.warning(f"Could not fetch existing playlist tracks: {e}")
+
+        return existing_ids, existing_keys
+
+    def _get_search_key(self, track: Track) -> Tuple[str, str]:
+        """Generate the key shared by tracks that resolve to the same search."""
+        artist_name = track.primary_artist.name if track.primary_artist else ""
+        return normalize_string(track.title or ""), normalize_string(artist_name)
+
+    def _unique_tracks(self, tracks: List[Track]) -> List[Track]:
+        """Drop tracks whose normalized title and artist were already seen."""
+        seen = set()
+        unique_tracks = []
+
+        for track in tracks:
+            search_key = self._get_search_key(track)
+            if search_key in seen:
+                continue
+            seen.add(search_key)
+            unique_tracks.append(track)
+
+        if len(unique_tracks) < len(tracks):
+            logger.info(
+                f"Skipping {len(tracks) - len(unique_tracks)} duplicate tracks "
+                f"in search"
+            )
+
+        return unique_tracks
+
     def _get_track_key(self, track: Track) -> str:
         """Generate a unique key for track caching."""
         artist_name = track.primary_artist.name if track.primary_artist else "Unknown"
@@ -367,8 +549,28 @@ class TidalService:
             logger.error(f"Error fetching playlists: {e}")
             return []
 
+    def _get_playlists_by_name(self) -> Dict[str, Any]:
+        """
+        Get the user's playlists keyed by name, fetching them only once.
+
+        The returned dictionary is shared and kept up to date as playlists are
+        created, so repeated lookups never re-fetch or scan the playlist list.
+        """
+        if self._playlists_by_name is None:
+            logger.info("📋 Fetching existing Tidal playlists...")
+            self._playlists_by_name = {
+                playlist.name: playlist
+                for playlist in self._get_all_playlists()
+                if hasattr(playlist, "name")
+            }
+            logger.info(f"Found {len(self._playlists_by_name)} existing playlists")
+        return self._playlists_by_name
+
     def _create_or_get_cached_playlist(
-        self, name: str, playlist_cache: Dict[str, Any]
+        self,
+        name: str,
+        playlist_cache: Dict[str, Any],
+        description: str = "Imported from Discogs",
     ) -> Any:
         """
         Create a new playlist or get existing one using cached playlist data.
@@ -376,6 +578,7 @@ class TidalService:
         Args:
             name: Playlist name
             playlist_cache: Dictionary of existing playlists by name
+            description: Playlist description for new playlists
 
         Returns:
             Tidal playlist object
@@ -388,7 +591,6 @@ class TidalService:
         # Create new playlist
         logger.info(f"Creating new playlist: {name}")
         try:
-            description = "Imported from Discogs"
             playlist = self.session.user.create_playlist(  # type: ignore[union-attr]
                 name, description
             )
@@ -434,31 +636,27 @@ class TidalService:
         added_count = 0
         failed_count = len(tracks) - len(tidal_tracks)  # Tracks not found on Tidal
 
-        # Add all found tracks at once if possible, or one by one
-        try:
-            if tidal_tracks:
-                tidal_track_ids = [track.id for track in tidal_tracks]
-                playlist.add(tidal_track_ids)
-                added_count = len(tidal_tracks)
-                logger.info(f"    ✅ Added {added_count} tracks to playlist in batch")
-            else:
-                logger.info("    ⚠️ No tracks found on Tidal to add")
-        except Exception as e:
-            # Fallback to individual track addition if batch fails
-            logger.warning(f"Batch add failed, trying individual adds: {e}")
-            added_count = 0
-
-            for i, tidal_track in enumerate(tidal_tracks, 1):
-                try:
-                    playlist.add([tidal_track.id])
-                    added_count += 1
-                    logger.debug(f"    ✅ Added track {i}/{len(tidal_tracks)}")
-                except Exception as track_error:
-                    logger.error(f"    ❌ Failed to add track {i}: {track_error}")
-                    failed_count += 1
+        # Only add tracks the playlist does not contain yet
+        existing_ids, _ = self._get_playlist_contents(playlist)
+        new_tidal_tracks = []
+        for tidal_track in tidal_tracks:
+            if tidal_track.id not in existing_ids:
+                existing_ids.add(tidal_track.id)
+                new_tidal_tracks.append(tidal_track)
+        already_present = len(tidal_tracks) - len(new_tidal_tracks)
+        if already_present:
+            logger.info(f"    Skipping {already_present} tracks already in playlist")
+
+        if new_tidal_tracks:
+            added_count, add_failures = self._add_tidal_tracks_in_batches(
+                playlist, new_tidal_tracks
+            )
+            failed_count += add_failures
+        elif not tidal_tracks:
+            logger.info("    ⚠️ No tracks found on Tidal to add")
 
         result = SyncResult(
-            success=added_count > 0,
+            success=added_count > 0 or already_present > 0,
             total_tracks=len(tracks),
             matched_tracks=len(tidal_tracks),
             failed_tracks=failed_count,
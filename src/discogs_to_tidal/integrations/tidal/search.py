@@ -1,7 +1,6 @@
 """
 Enhanced Tidal search functionality with album-based optimization.
 """
-import difflib
 import json
 import logging
 import re
@@ -11,17 +10,63 @@ from typing import Any, Dict, List, Optional, Tuple, cast
 import tidalapi
 
 from ...core.models import Album, Track
-from ...utils.string_utils import normalize_string
+from ...utils.rate_limit import RateLimiter
+from ...utils.string_utils import normalize_string, similarity_ratio, similarity_ratios
+from .search_cache import SearchCache
 
 logger = logging.getLogger(__name__)
 
+# Title/artist cleanup patterns, compiled once since they run for every
+# Discogs track and every Tidal candidate
+_PARENTHETICAL_RE = re.compile(r"\(.*?\)")
+_TITLE_STRIP_PATTERNS = tuple(
+    re.compile(pattern, flags)
+    for pattern, flags in (
+        # Remove feat./featuring variations more aggressively
+        (r"\s*\(?\s*[Ff]eat\.?\s+[^)]*\)?", 0),
+        (r"\s*\(?\s*[Ff]eaturing\s+[^)]*\)?", 0),
+        (r"\s*\(?\s*[Ff]t\.?\s+[^)]*\)?", 0),
+        # Remove all parenthetical content for fuzzy matching
+        (r"\s*\([^)]*\)", 0),
+        # Remove square brackets content
+        (r"\s*\[[^\]]*\]", 0),
+        # Remove common remix/version indicators that might differ
+        (r"\s*\-\s*[^-]*[Rr]emix[^-]*", 0),
+        (r"\s*\-\s*[^-]*[Vv]ersion[^-]*", 0),
+        (r"\s*\-\s*[^-]*[Mm]ix[^-]*", 0),
+        (r"\s*\-\s*[^-]*[Ee]dit[^-]*", 0),
+        (r"\s*\-\s*Original\s*$", 0),
+        # Remove common suffixes
+        (r"\s*\-\s*Remastered.*$", re.IGNORECASE),
+        (r"\s*\-\s*Radio.*$", re.IGNORECASE),
+        # Remove quotes
+        (r'[\'\""`]', 0),
+    )
+)
+_ARTIST_STRIP_PATTERNS = (
+    # Remove parenthetical content like "(Original Artist)" or "(Remix)"
+    re.compile(r"\s*\([^)]*\)"),
+    # Remove common prefixes that might differ between services
+    re.compile(r"^(The\s+)", re.IGNORECASE),
+    # Remove featuring information that might be formatted differently
+    re.compile(r"\s+(feat\.?|featuring|ft\.?|f\.)\s+.*$", re.IGNORECASE),
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 class TidalSearchService:
     """Enhanced service for searching tracks on Tidal with album optimization."""
 
-    def __init__(self, session: tidalapi.Session):
+    def __init__(
+        self, session: tidalapi.Session, search_cache: Optional[SearchCache] = None
+    ):
         self.session = session
+        self.search_cache = search_cache
         self.album_cache: Dict[str, Optional[List[tidalapi.Track]]] = {}
+        self.track_cache: Dict[str, Optional[tidalapi.Track]] = {}
+
+        # Shared by concurrent searches to stay under Tidal's ~10 requests/second
+        self._rate_limiter = RateLimiter(calls=10, period=1.0)
 
     def find_tracks_by_album(
         self, album: Album, tracks: List[Track], output_file: Optional[Path] = None
@@ -158,7 +203,7 @@ class TidalSearchService:
             logger.debug(f"  Searching for album: {query}")
 
             try:
-                result = self.session.search(query)
+                result = self._search(query)
                 albums = result.get("albums", [])
 
                 for tidal_album in albums:
@@ -206,7 +251,7 @@ class TidalSearchService:
             queries.append(f'album:"{norm_title}" artist:"{norm_artist}"')
             queries.append(f"{norm_title} {norm_artist}")
 
-        return queries
+        return self._unique_queries(queries)
 
     def _is_album_match(
         self, discogs_album: Album, tidal_album: tidalapi.Album
@@ -218,7 +263,7 @@ class TidalSearchService:
         discogs_title = normalize_string(self._clean_title(discogs_title_str))
         tidal_title = normalize_string(self._clean_title(tidal_title_str))
 
-        title_ratio = difflib.SequenceMatcher(None, discogs_title, tidal_title).ratio()
+        title_ratio = similarity_ratio(discogs_title, tidal_title, score_cutoff=0.8)
 
         # Compare primary artist
         if not discogs_album.primary_artist:
@@ -232,9 +277,7 @@ class TidalSearchService:
         tidal_artist_name = tidal_artist_name or ""  # Handle None case
         tidal_artist = normalize_string(self._clean_artist(tidal_artist_name))
 
-        artist_ratio = difflib.SequenceMatcher(
-            None, discogs_artist, tidal_artist
-        ).ratio()
+        artist_ratio = similarity_ratio(discogs_artist, tidal_artist, score_cutoff=0.8)
 
         # Threshold for album matching (more lenient than track matching)
         return title_ratio > 0.8 and artist_ratio > 0.8
@@ -258,19 +301,11 @@ class TidalSearchService:
         best_score = 0.0
 
         for tidal_track in tidal_tracks:
-            tidal_title_str = tidal_track.name or ""
-            tidal_title = normalize_string(self._clean_title(tidal_title_str))
-            tidal_artist_name = tidal_track.artist.name if tidal_track.artist else ""
-            tidal_artist_name = tidal_artist_name or ""  # Handle None case
-            tidal_artist = normalize_string(self._clean_artist(tidal_artist_name))
+            tidal_title, tidal_artist = self._normalize_candidate(tidal_track)
 
             # Calculate similarity scores
-            title_ratio = difflib.SequenceMatcher(
-                None, discogs_title, tidal_title
-            ).ratio()
-            artist_ratio = difflib.SequenceMatcher(
-                None, discogs_artist, tidal_artist
-            ).ratio()
+            title_ratio = similarity_ratio(discogs_title, tidal_title, score_cutoff=0.6)
+            artist_ratio = similarity_ratio(discogs_artist, tidal_artist)
 
             # Weight title more heavily since we already know the album matches
             combined_score = (title_ratio * 0.7) + (artist_ratio * 0.3)
@@ -366,17 +401,72 @@ class TidalSearchService:
             logger.warning(f"Skipping track with missing title or artist: {track}")
             return None
 
+        # The same track often appears on several releases in a collection
+        cache_key = f"{normalize_string(title)}_{normalize_string(artist)}"
+        if cache_key in self.track_cache:
+            return self.track_cache[cache_key]
+
+        tidal_track = self._lookup_track(title, artist)
+        self.track_cache[cache_key] = tidal_track
+        return tidal_track
+
+    def _lookup_track(self, title: str, artist: str) -> Optional[tidalapi.Track]:
+        """Find a track via the persistent search cache or a Tidal search."""
+        if self.search_cache is None:
+            return self._search_track(title, artist)
+
+        # Consult the persistent cache before hitting the network
+        cache_key = self.search_cache.make_key(title, artist)
+        cached_id = self.search_cache.get(cache_key)
+
+        if cached_id == SearchCache.NOT_FOUND:
+            logger.debug(f"  Cached miss: {title} by {artist}")
+            return None
+
+        if cached_id is not None:
+            try:
+                logger.debug(f"  Cached match: {title} by {artist} -> {cached_id}")
+                return self.session.track(str(cached_id))
+            except Exception as e:
+                logger.debug(f"  Cached track {cached_id} unavailable: {e}")
+
+        tidal_track, search_failed = self._search_track_queries(title, artist)
+        if tidal_track is not None:
+            self.search_cache.put(cache_key, tidal_track.id)
+        elif not search_failed:
+            # Only a clean "no match" is remembered; errors are retried next run
+            self.search_cache.put(cache_key, None)
+        return tidal_track
+
+    def _search_track(self, title: str, artist: str) -> Optional[tidalapi.Track]:
+        """Search Tidal for a track by title and artist."""
+        return self._search_track_queries(title, artist)[0]
+
+    def _search_track_queries(
+        self, title: str, artist: str
+    ) -> Tuple[Optional[tidalapi.Track], bool]:
+        """
+        Run the search queries for a track until one gives a good match.
+
+        Returns:
+            The matched Tidal track (or None) and whether any query errored
+        """
         logger.debug(f"Searching for: {title} by {artist}")
 
         # Generate search queries with increasing specificity
         queries = self._generate_track_queries(title, artist)
 
+        # Normalize the target once for all queries
+        norm_title = normalize_string(self._clean_title(title))
+        norm_artist = normalize_string(self._clean_artist(artist))
+
         # Try each query
+        search_failed = False
         for search_query in queries:
             logger.debug(f"  Searching Tidal for: {search_query}")
 
             try:
-                result = self.session.search(search_query)
+                result = self._search(search_query)
                 tracks = result.get("tracks", [])
 
                 if not tracks:
@@ -384,16 +474,24 @@ class TidalSearchService:
                     continue
 
                 # Find best match
-                best_match = self._find_best_track_match(tracks, title, artist)
+                best_match = self._find_best_track_match(
+                    tracks, norm_title, norm_artist
+                )
                 if best_match:
-                    return best_match
+                    return best_match, search_failed
 
             except Exception as e:
                 logger.warning(f"Search failed for query '{search_query}': {e}")
+                search_failed = True
                 continue
 
         logger.debug(f"  Not found on Tidal: {title} by {artist}")
-        return None
+        return None, search_failed
+
+    def _search(self, query: str) -> Dict[str, Any]:
+        """Run a Tidal search once the rate limiter allows another request."""
+        self._rate_limiter.acquire()
+        return cast(Dict[str, Any], self.session.search(query))
 
     def _generate_track_queries(self, title: str, artist: str) -> List[str]:
         """Generate search queries for individual track search."""
@@ -407,12 +505,25 @@ class TidalSearchService:
         ]
 
         # Try without parenthetical content
-        base_title = re.sub(r"\(.*?\)", "", clean_title).strip()
+        base_title = _PARENTHETICAL_RE.sub("", clean_title).strip()
         if base_title != clean_title and base_title:
             queries.append(f'track:"{base_title}" artist:"{clean_artist}"')
             queries.append(f"{base_title} {clean_artist}")
 
-        return queries
+        return self._unique_queries(queries)
+
+    def _unique_queries(self, queries: List[str]) -> List[str]:
+        """Drop blank and repeated queries, keeping the original order."""
+        seen = set()
+        unique = []
+        for query in queries:
+            # Tidal search ignores case and spacing, so e.g. the normalized
+            # variant of a plain ASCII title is the same search again
+            key = " ".join(query.lower().split())
+            if key and key not in seen:
+                seen.add(key)
+                unique.append(query.strip())
+        return unique
 
     def _clean_title(self, title: str) -> str:
         """Clean and normalize track/album title."""
@@ -421,37 +532,11 @@ class TidalSearchService:
 
         # Remove common patterns that differ between platforms
         cleaned = title
+        for pattern in _TITLE_STRIP_PATTERNS:
+            cleaned = pattern.sub("", cleaned)
 
-        # Remove feat./featuring variations more aggressively
-        cleaned = re.sub(r"\s*\(?\s*[Ff]eat\.?\s+[^)]*\)?", "", cleaned)
-        cleaned = re.sub(r"\s*\(?\s*[Ff]eaturing\s+[^)]*\)?", "", cleaned)
-        cleaned = re.sub(r"\s*\(?\s*[Ff]t\.?\s+[^)]*\)?", "", cleaned)
-
-        # Remove all parenthetical content for fuzzy matching
-        cleaned = re.sub(r"\s*\([^)]*\)", "", cleaned)
-
-        # Remove square brackets content
-        cleaned = re.sub(r"\s*\[[^\]]*\]", "", cleaned)
-
-        # Remove common remix/version indicators that might differ
-        remix_patterns = [
-            r"\s*\-\s*[^-]*[Rr]emix[^-]*",
-            r"\s*\-\s*[^-]*[Vv]ersion[^-]*",
-            r"\s*\-\s*[^-]*[Mm]ix[^-]*",
-            r"\s*\-\s*[^-]*[Ee]dit[^-]*",
-            r"\s*\-\s*Original\s*$",
-        ]
-
-        for pattern in remix_patterns:
-            cleaned = re.sub(pattern, "", cleaned)
-
-        # Remove common suffixes
-        cleaned = re.sub(r"\s*\-\s*Remastered.*$", "", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r"\s*\-\s*Radio.*$", "", cleaned, flags=re.IGNORECASE)
-
-        # Clean up punctuation and whitespace
-        cleaned = re.sub(r'[\'\""`]', "", cleaned)  # Remove quotes
-        cleaned = re.sub(r"\s+", " ", cleaned).strip()
+        # Clean up whitespace
+        cleaned = _WHITESPACE_RE.sub(" ", cleaned).strip()
 
         return cleaned
 
@@ -467,67 +552,82 @@ class TidalSearchService:
         if cleaned.lower() in ["various artists", "various", "va"]:
             return ""
 
-        # Remove parenthetical content like "(Original Artist)" or "(Remix)"
-        cleaned = re.sub(r"\s*\([^)]*\)", "", cleaned)
-
-        # Remove common prefixes that might differ between services
-        cleaned = re.sub(r"^(The\s+)", "", cleaned, flags=re.IGNORECASE)
-
-        # Remove featuring information that might be formatted differently
-        cleaned = re.sub(
-            r"\s+(feat\.?|featuring|ft\.?|f\.)\s+.*$", "", cleaned, flags=re.IGNORECASE
-        )
+        for pattern in _ARTIST_STRIP_PATTERNS:
+            cleaned = pattern.sub("", cleaned)
 
         # Normalize ampersands and common variations
         cleaned = cleaned.replace("&", "and")
         cleaned = cleaned.replace(" + ", " and ")
 
         # Clean up whitespace
-        cleaned = re.sub(r"\s+", " ", cleaned).strip()
+        cleaned = _WHITESPACE_RE.sub(" ", cleaned).strip()
 
         return cleaned
 
     def _find_best_track_match(
-        self, tidal_tracks: List[tidalapi.Track], target_title: str, target_artist: str
+        self, tidal_tracks: List[tidalapi.Track], norm_title: str, norm_artist: str
     ) -> Optional[tidalapi.Track]:
-        """Find the best matching track from Tidal search results."""
-        norm_title = normalize_string(self._clean_title(target_title))
-        norm_artist = normalize_string(self._clean_artist(target_artist))
+        """
+        Find the best matching track from Tidal search results.
+
+        Args:
+            tidal_tracks: Candidate tracks from a Tidal search
+            norm_title: Cleaned and normalized target title
+            norm_artist: Cleaned and normalized target artist
 
+        Returns:
+            Best matching Tidal track, or None if nothing is close enough
+        """
         logger.debug(f"    Searching for: '{norm_title}' by '{norm_artist}'")
         logger.debug(f"    Found {len(tidal_tracks)} Tidal tracks to evaluate")
 
-        # First pass: find tracks with decent artist matches (more lenient)
-        artist_matches = []
+        # Normalize every candidate once; titles are reused in the scoring pass.
+        # An exact match scores 1.0, which nothing can beat, so return it
+        # without scoring the remaining candidates.
+        candidates = []
         for tidal_track in tidal_tracks:
-            t_artist_name = tidal_track.artist.name if tidal_track.artist else ""
-            t_artist_name = t_artist_name or ""  # Handle None case
-            t_artist = normalize_string(self._clean_artist(t_artist_name))
-            artist_ratio = difflib.SequenceMatcher(None, t_artist, norm_artist).ratio()
+            candidate = self._normalize_candidate(tidal_track)
+            if norm_title and candidate == (norm_title, norm_artist):
+                logger.debug(
+                    f"    ✓ Exact match: '{tidal_track.name}' (id: {tidal_track.id})"
+                )
+                return tidal_track
+            candidates.append(candidate)
+
+        # Score all artists in one batch; nothing below the lenient fallback
+        # threshold is ever used, so let the scorer bail out early
+        artist_ratios = similarity_ratios(
+            norm_artist, [t_artist for _, t_artist in candidates], score_cutoff=0.5
+        )
 
+        artist_scores = []
+        for tidal_track, (t_title, t_artist), artist_ratio in zip(
+            tidal_tracks, candidates, artist_ratios
+        ):
+            # Lazy %-formatting keeps this per-candidate log free when disabled
             logger.debug(
-                f"      Artist comparison: '{t_artist}' vs '{norm_artist}' "
-                f"= {artist_ratio:.2f}"
+                "      Artist comparison: '%s' vs '%s' = %.2f",
+                t_artist,
+                norm_artist,
+                artist_ratio,
             )
+            artist_scores.append((tidal_track, t_title, artist_ratio))
 
-            if artist_ratio > 0.65:  # More lenient artist matching
-                artist_matches.append((tidal_track, artist_ratio))
+        # First pass: find tracks with decent artist matches (more lenient)
+        artist_matches = [
+            (tidal_track, t_title, artist_ratio)
+            for tidal_track, t_title, artist_ratio in artist_scores
+            if artist_ratio > 0.65
+        ]
 
         if not artist_matches:
             logger.debug("    No decent artist match found (threshold: 0.65)")
             # Try even more lenient matching for difficult cases
-            for tidal_track in tidal_tracks:
-                t_artist_name_fallback = (
-                    tidal_track.artist.name if tidal_track.artist else ""
-                )
-                # Handle None case
-                t_artist_name_fallback = t_artist_name_fallback or ""
-                t_artist = normalize_string(self._clean_artist(t_artist_name_fallback))
-                artist_ratio = difflib.SequenceMatcher(
-                    None, t_artist, norm_artist
-                ).ratio()
-                if artist_ratio > 0.5:  # Very lenient fallback
-                    artist_matches.append((tidal_track, artist_ratio))
+            artist_matches = [
+                (tidal_track, t_title, artist_ratio)
+                for tidal_track, t_title, artist_ratio in artist_scores
+                if artist_ratio > 0.5  # Very lenient fallback
+            ]
 
             if not artist_matches:
                 logger.debug("    Still no match even with lenient threshold (0.5)")
@@ -537,20 +637,24 @@ class TidalSearchService:
         best = None
         best_score = 0.0
 
-        for tidal_track, artist_ratio in artist_matches:
-            track_name = tidal_track.name or ""
-            t_title = normalize_string(self._clean_title(track_name))
-            title_ratio = difflib.SequenceMatcher(None, t_title, norm_title).ratio()
+        title_ratios = similarity_ratios(
+            norm_title, [t_title for _, t_title, _ in artist_matches], score_cutoff=0.6
+        )
+
+        for (tidal_track, _, artist_ratio), title_ratio in zip(
+            artist_matches, title_ratios
+        ):
             # Weight title more heavily than artist
             score = (artist_ratio * 0.3) + (title_ratio * 0.7)
 
-            track_artist_name = (
-                tidal_track.artist.name if tidal_track.artist else "Unknown"
-            )
             logger.debug(
-                f"      Tidal: '{tidal_track.name}' by '{track_artist_name}' "
-                f"(artist_score={artist_ratio:.2f}, title_score={title_ratio:.2f}, "
-                f"combined={score:.2f})"
+                "      Tidal: '%s' by '%s' "
+                "(artist_score=%.2f, title_score=%.2f, combined=%.2f)",
+                tidal_track.name,
+                tidal_track.artist.name if tidal_track.artist else "Unknown",
+                artist_ratio,
+                title_ratio,
+                score,
             )
 
             if title_ratio > 0.6 and score > best_score:  # More lenient title matching
@@ -568,6 +672,13 @@ class TidalSearchService:
 
         return best
 
+    def _normalize_candidate(self, tidal_track: tidalapi.Track) -> Tuple[str, str]:
+        """Clean and normalize a Tidal track's title and artist for comparison."""
+        t_title = normalize_string(self._clean_title(tidal_track.name or ""))
+        t_artist_name = tidal_track.artist.name if tidal_track.artist else ""
+        t_artist = normalize_string(self._clean_artist(t_artist_name or ""))
+        return t_title, t_artist
+
     def _create_track_conversion_data(
         self, discogs_track: Track, tidal_track: Optional[tidalapi.Track]
     ) -> Dict[str, Any]:
@@ -0,0 +1,139 @@
+"""
+Persistent cache of Tidal track search results.
+"""
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from ...core.config import Config
+from ...utils.string_utils import normalize_string
+
+logger = logging.getLogger(__name__)
+
+
+class SearchCache:
+    """
+    SQLite-backed cache mapping normalized (title, artist) pairs to Tidal IDs.
+
+    Successful matches are kept indefinitely since they rarely change. Misses
+    are stored as a ``NOT_FOUND`` sentinel that expires after a TTL, so tracks
+    which were not on Tidal are retried occasionally. The cache is best-effort:
+    any database error disables it and searches fall back to the network.
+    """
+
+    NOT_FOUND = -1
+
+    def __init__(self, db_path: Path, negative_ttl_hours: float = 24):
+        self.db_path = Path(db_path)
+        self.negative_ttl_seconds = negative_ttl_hours * 3600
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Config) -> "SearchCache":
+        """Create a cache stored in the configured cache directory."""
+        return cls(
+            config.cache_dir / "tidal_search_cache.sqlite3",
+            negative_ttl_hours=config.cache_expiry_hours,
+        )
+
+    @staticmethod
+    def make_key(title: str, artist: str) -> str:
+        """Build the cache key for a track title and artist."""
+        raw_key = f"{normalize_string(title)}|{normalize_string(artist)}"
+        return hashlib.sha1(raw_key.encode("utf-8")).hexdigest()
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the database on first use; returns None if unavailable."""
+        if self._conn is not None or self._disabled:
+            return self._conn
+
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS search_results ("
+                "key TEXT PRIMARY KEY, "
+                "track_id INTEGER NOT NULL, "
+                "updated_at REAL NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Search cache unavailable, continuing without it: {e}")
+            self._disabled = True
+
+        return self._conn
+
+    def get(self, key: str) -> Optional[int]:
+        """
+        Look up a cached search result.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Tidal track ID, NOT_FOUND for a recent miss, or None if not cached
+        """
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+
+            try:
+                row = conn.execute(
+                    "SELECT track_id, updated_at FROM search_results WHERE key = ?",
+                    (key,),
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"Search cache lookup failed: {e}")
+                return None
+
+        if row is None:
+            return None
+
+        track_id, updated_at = row
+        if track_id == self.NOT_FOUND:
+            if time.time() - updated_at > self.negative_ttl_seconds:
+                return None  # Expired miss, allow a fresh search
+            return self.NOT_FOUND
+
+        return int(track_id)
+
+    def put(self, key: str, track_id: Optional[int]) -> None:
+        """
+        Store a search result.
+
+        Args:
+            key: Cache key from make_key()
+            track_id: Tidal track ID, or None if the track was not found
+        """
+        value = self.NOT_FOUND if track_id is None else int(track_id)
+
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO search_results "
+                    "(key, track_id, updated_at) VALUES (?, ?, ?)",
+                    (key, value, time.time()),
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to update search cache: {e}")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
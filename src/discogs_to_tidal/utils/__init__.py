@@ -1,7 +1,20 @@
 """
 Utilities package.
 """
+from .http_utils import configure_connection_pool
+from .json_utils import dump_json, dump_json_stream, load_json
 from .music_utils import extract_track_info
-from .string_utils import normalize_string
+from .rate_limit import RateLimiter
+from .string_utils import normalize_string, similarity_ratio, similarity_ratios
 
-__all__ = ["normalize_string", "extract_track_info"]
+__all__ = [
+    "normalize_string",
+    "similarity_ratio",
+    "similarity_ratios",
+    "extract_track_info",
+    "configure_connection_pool",
+    "load_json",
+    "dump_json",
+    "dump_json_stream",
+    "RateLimiter",
+]
@@ -0,0 +1,47 @@
+"""
+HTTP utilities.
+"""
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Transient statuses worth retrying (rate limiting and gateway errors)
+RETRY_STATUS_CODES = (429, 502, 503)
+
+
+def configure_connection_pool(
+    http_session: requests.Session,
+    pool_size: int = 32,
+    max_retries: int = 5,
+    backoff_factor: float = 0.3,
+) -> None:
+    """
+    Mount a pooled, retrying adapter on a requests session.
+
+    Keeps up to ``pool_size`` keep-alive connections per host so concurrent
+    requests reuse established TLS connections instead of handshaking again,
+    and retries transient failures with exponential backoff (honouring any
+    ``Retry-After`` header).
+
+    Args:
+        http_session: Session to configure
+        pool_size: Number of connection pools and connections per pool
+        max_retries: Total number of retries per request
+        backoff_factor: Backoff multiplier between retries
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+    http_session.mount("https://", adapter)
+    http_session.mount("http://", adapter)
+    logger.debug(f"Configured HTTP connection pool (size={pool_size})")
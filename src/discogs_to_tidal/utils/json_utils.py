@@ -0,0 +1,98 @@
+"""
+JSON file utilities.
+"""
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, cast
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, install with the "fast" extra
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+
+def load_json(path: Path) -> Any:
+    """
+    Load JSON data from a file.
+
+    Uses orjson when it is installed, falling back to the standard library.
+
+    Args:
+        path: File to read
+
+    Returns:
+        Decoded JSON data
+    """
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def dump_json(data: Any, path: Path, indent: bool = True) -> None:
+    """
+    Write data to a file as UTF-8 JSON.
+
+    Uses orjson when it is installed, falling back to the standard library.
+    Non-ASCII characters are written as-is in both cases.
+
+    Args:
+        data: JSON-serializable data
+        path: File to write
+        indent: Pretty-print with two-space indentation
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=option))
+        return
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2 if indent else None, ensure_ascii=False)
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize data to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return cast(bytes, orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def dump_json_stream(
+    header: Dict[str, Any], key: str, items: Iterable[Any], path: Path
+) -> int:
+    """
+    Write ``{**header, key: [*items]}`` to a file one item at a time.
+
+    Items are serialized and written as they are produced, one per line, so
+    large exports never hold the full document in memory. The result is a
+    regular JSON document that load_json() can read back.
+
+    Args:
+        header: Top-level fields written before the item list
+        key: Name of the top-level field holding the items
+        items: JSON-serializable items, typically a generator
+        path: File to write
+
+    Returns:
+        Number of items written
+    """
+    count = 0
+    with open(path, "wb") as f:
+        f.write(b"{")
+        for name, value in header.items():
+            f.write(_dumps(name) + b": " + _dumps(value) + b",\n")
+        f.write(_dumps(key) + b": [")
+
+        for item in items:
+            f.write(b",\n" if count else b"\n")
+            f.write(_dumps(item))
+            count += 1
+
+        f.write(b"\n]}\n")
+
+    return count
@@ -0,0 +1,65 @@
+"""
+Rate limiting utilities.
+"""
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Thread-safe token-bucket rate limiter.
+
+    The bucket holds up to ``calls`` tokens and refills at ``calls / period``
+    tokens per second, so short bursts run at full speed while the sustained
+    rate stays within the limit. Callers block only when the bucket is empty.
+
+    The bucket can be synced with a server-reported remaining budget via
+    update_remaining(), so the client slows down as soon as the server says
+    the budget is nearly used up.
+    """
+
+    def __init__(self, calls: int, period: float):
+        if calls <= 0:
+            raise ValueError("calls must be positive")
+        if period <= 0:
+            raise ValueError("period must be positive")
+
+        self.calls = calls
+        self.period = period
+        self._rate = calls / period
+        self._tokens = float(calls)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update (lock must be held)."""
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.calls), self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+
+                wait_time = (1.0 - self._tokens) / self._rate
+
+            # Sleep outside the lock so other threads can check in
+            time.sleep(wait_time)
+
+    def update_remaining(self, remaining: int) -> None:
+        """
+        Cap the available tokens at a server-reported remaining budget.
+
+        Args:
+            remaining: Requests the server still allows in the current window
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, float(max(0, remaining)))
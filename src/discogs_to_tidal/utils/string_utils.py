@@ -1,14 +1,32 @@
 """
 String manipulation utilities.
 """
+import difflib
 import re
 import unicodedata
+from functools import lru_cache
+from typing import List, Sequence
 
+try:
+    from rapidfuzz import fuzz as _rapidfuzz_fuzz
+    from rapidfuzz import process as _rapidfuzz_process
+except ImportError:  # Optional speedup, install with the "fast" extra
+    _rapidfuzz_fuzz = None  # type: ignore[assignment, unused-ignore]
+    _rapidfuzz_process = None  # type: ignore[assignment, unused-ignore]
 
+# Precompiled patterns for the hot normalization path
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=65536)
 def normalize_string(text: str) -> str:
     """
     Normalize a string for comparison purposes.
 
+    Results are memoized since the same titles and artists are normalized
+    repeatedly while scoring search candidates.
+
     Args:
         text: Input string to normalize
 
@@ -26,12 +44,103 @@ def normalize_string(text: str) -> str:
     text = "".join(c for c in text if unicodedata.category(c) != "Mn")
 
     # Remove common punctuation and special characters
-    text = re.sub(r"[^\w\s]", " ", text)
+    text = _PUNCTUATION_RE.sub(" ", text)
 
     # Replace multiple whitespace with single space
-    text = re.sub(r"\s+", " ", text)
+    text = _WHITESPACE_RE.sub(" ", text)
 
     # Strip leading/trailing whitespace
     text = text.strip()
 
     return text
+
+
+def similarity_ratio(a: str, b: str, score_cutoff: float = 0.0) -> float:
+    """
+    Compute the similarity of two strings as a ratio between 0.0 and 1.0.
+
+    Uses RapidFuzz's C++ implementation when it is installed and falls back
+    to difflib otherwise. Both return ``2 * M / (len(a) + len(b))``; RapidFuzz
+    counts matches via the longest common subsequence, so scores may differ
+    marginally from difflib's.
+
+    Since ``M`` can never exceed the shorter string's length, pairs whose
+    lengths alone rule out reaching ``score_cutoff`` are rejected without
+    running the full comparison.
+
+    Args:
+        a: First string
+        b: Second string
+        score_cutoff: Minimum ratio of interest; lower scores return 0.0
+
+    Returns:
+        Similarity ratio, where 1.0 means identical
+    """
+    if _exceeds_length_bound(a, b, score_cutoff):
+        return 0.0
+
+    if _rapidfuzz_fuzz is not None:
+        score = _rapidfuzz_fuzz.ratio(a, b, score_cutoff=score_cutoff * 100)
+        return float(score) / 100.0
+
+    return _difflib_ratio(difflib.SequenceMatcher(None, b, a), score_cutoff)
+
+
+def similarity_ratios(
+    query: str, choices: Sequence[str], score_cutoff: float = 0.0
+) -> List[float]:
+    """
+    Compute similarity_ratio() of one string against many.
+
+    With RapidFuzz installed all choices are scored in a single C++ call
+    instead of one Python-level call per pair.
+
+    Args:
+        query: String to compare against each choice
+        choices: Strings to score
+        score_cutoff: Minimum ratio of interest; lower scores are 0.0
+
+    Returns:
+        Similarity ratio for each choice, in the same order
+    """
+    if _rapidfuzz_process is None:
+        # difflib indexes seq2, so index the query once and swap choices in
+        matcher = difflib.SequenceMatcher(None, "", query)
+        ratios = []
+        for choice in choices:
+            if _exceeds_length_bound(query, choice, score_cutoff):
+                ratios.append(0.0)
+                continue
+            matcher.set_seq1(choice)
+            ratios.append(_difflib_ratio(matcher, score_cutoff))
+        return ratios
+
+    ratios = [0.0] * len(choices)
+    for _, score, index in _rapidfuzz_process.extract(
+        query,
+        choices,
+        scorer=_rapidfuzz_fuzz.ratio,
+        limit=None,
+        score_cutoff=score_cutoff * 100,
+    ):
+        ratios[index] = float(score) / 100.0
+    return ratios
+
+
+def _exceeds_length_bound(a: str, b: str, score_cutoff: float) -> bool:
+    """Check whether the lengths alone keep a and b below score_cutoff."""
+    if score_cutoff <= 0.0:
+        return False
+    total_length = len(a) + len(b)
+    return bool(total_length) and 2 * min(len(a), len(b)) / total_length < score_cutoff
+
+
+def _difflib_ratio(matcher: difflib.SequenceMatcher, score_cutoff: float) -> float:
+    """Return matcher.ratio(), or 0.0 if it is below score_cutoff."""
+    # quick_ratio() is an O(n) upper bound on ratio(), far cheaper than the
+    # full matching-blocks search
+    if score_cutoff > 0.0 and matcher.quick_ratio() < score_cutoff:
+        return 0.0
+
+    ratio = matcher.ratio()
+    return ratio if ratio >= score_cutoff else 0.0
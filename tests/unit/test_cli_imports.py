@@ -0,0 +1,49 @@
+"""
+Unit tests for the CLI's lazy import behaviour.
+"""
+import subprocess
+import sys
+import unittest
+
+# Modules that only the commands talking to Tidal or Discogs should pull in
+HEAVY_MODULES = ["tidalapi", "discogs_client", "discogs_to_tidal.integrations"]
+
+PROBE = """
+import sys
+from discogs_to_tidal.cli import cli
+{action}
+print("\\n".join(sorted(sys.modules)))
+"""
+
+
+class TestCliImports(unittest.TestCase):
+    """Test that the CLI only imports integrations on demand."""
+
+    def _loaded_modules(self, action=""):
+        """Run the probe in a fresh interpreter and return its sys.modules."""
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE.format(action=action)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return set(result.stdout.split())
+
+    def test_import_skips_integrations(self):
+        """Test that importing the CLI doesn't load the service clients."""
+        loaded = self._loaded_modules()
+
+        for module in HEAVY_MODULES:
+            self.assertNotIn(module, loaded)
+
+    def test_listing_commands_skips_integrations(self):
+        """Test that listing commands for --help doesn't load command modules."""
+        loaded = self._loaded_modules("cli.list_commands(None)")
+
+        for module in HEAVY_MODULES:
+            self.assertNotIn(module, loaded)
+        self.assertNotIn("discogs_to_tidal.cli.commands.sync", loaded)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -346,6 +346,22 @@ class TestConfig(unittest.TestCase):
 
                     self.assertIsNone(result)
 
+    def test_get_discogs_token_not_found_checked_once(self):
+        """Test get_discogs_token() doesn't search again after a miss."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch.object(
+                Config, "_find_project_root", return_value=Path(temp_dir)
+            ):
+                with patch.object(Config, "load_tokens_from_storage"):
+                    config = Config()
+                    config.discogs_token = None
+
+                    with patch.dict(os.environ, {}, clear=True):
+                        self.assertIsNone(config.get_discogs_token())
+                        with patch("os.getenv") as mock_getenv:
+                            self.assertIsNone(config.get_discogs_token())
+                            mock_getenv.assert_not_called()
+
     def test_get_discogs_token_already_loaded(self):
         """Test get_discogs_token() with token already loaded."""
         with patch.object(Config, "load_tokens_from_storage"):
@@ -808,6 +824,38 @@ MAX_TRACKS=500"""
                     cache_dir = config.cache_dir
                     self.assertEqual(cache_dir, project_root / ".cache")
 
+    def test_env_file_present_checked_once(self):
+        """Test env_file_present caches the .env lookup."""
+        with patch.object(Config, "load_tokens_from_storage"):
+            config = Config()
+
+        with patch("pathlib.Path.is_file", return_value=True) as mock_is_file:
+            self.assertTrue(config.env_file_present)
+            self.assertTrue(config.env_file_present)
+
+        mock_is_file.assert_called_once()
+        self.assertNotIn("_env_file_present", config.to_dict())
+
+    def test_copy_resets_per_run_state(self):
+        """Test copy() keeps settings but drops tokens and lookups set later."""
+        with patch.object(Config, "load_tokens_from_storage"):
+            config = Config(discogs_token=None, max_tracks=5)
+        config.discogs_token = "unvalidated"
+        config._discogs_token_searched = True
+        config._env_file_present = True
+
+        with patch.object(Config, "_find_project_root") as mock_find_root:
+            with patch.object(Config, "load_tokens_from_storage"):
+                copied = config.copy()
+
+        mock_find_root.assert_not_called()
+        self.assertIsNot(copied, config)
+        self.assertEqual(copied.max_tracks, 5)
+        self.assertIsNone(copied.discogs_token)
+        self.assertFalse(copied._discogs_token_searched)
+        self.assertIsNone(copied._env_file_present)
+        self.assertEqual(config.discogs_token, "unvalidated")
+
     def test_ensure_directories_windows_no_chmod(self):
         """Test ensure_directories on Windows doesn't call chmod."""
         with tempfile.TemporaryDirectory() as temp_dir:
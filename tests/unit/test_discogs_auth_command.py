@@ -0,0 +1,37 @@
+"""
+Unit tests for the discogs-auth command.
+"""
+import unittest
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from discogs_to_tidal.cli import cli
+
+COMMAND_MODULE = "discogs_to_tidal.cli.commands.discogs_auth"
+
+
+class TestDiscogsAuthCommand(unittest.TestCase):
+    """Test cases for the discogs-auth command."""
+
+    @patch(f"{COMMAND_MODULE}.click.confirm", return_value=True)
+    @patch(f"{COMMAND_MODULE}.getpass.getpass", return_value="bad-token")
+    @patch(f"{COMMAND_MODULE}.DiscogsService")
+    @patch(f"{COMMAND_MODULE}.get_config")
+    def test_gives_up_after_max_attempts(
+        self, mock_get_config, mock_service_cls, mock_getpass, mock_confirm
+    ):
+        """Test that repeated bad tokens stop at the attempt cap with exit 1."""
+        mock_get_config.return_value.get_discogs_token.return_value = None
+        mock_service_cls.return_value.authenticate.side_effect = Exception("401")
+
+        result = CliRunner().invoke(cli, ["discogs-auth"])
+
+        self.assertEqual(result.exit_code, 1)
+        self.assertEqual(mock_getpass.call_count, 5)
+        self.assertIn("No valid token after 5 attempts", result.output)
+        self.assertNotIn("Unexpected error", result.output)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Unit tests for utils.json_utils module.
+"""
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from discogs_to_tidal.utils.json_utils import dump_json, dump_json_stream, load_json
+
+
+class TestJsonUtils(unittest.TestCase):
+    """Test cases for JSON file helpers."""
+
+    def setUp(self):
+        """Set up a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "data.json"
+
+    def tearDown(self):
+        """Remove temporary files."""
+        self.temp_dir.cleanup()
+
+    def test_round_trip(self):
+        """Test that dumped data loads back unchanged."""
+        data = {"releases": {"123": {"title": "Café", "styles": ["House"]}}}
+
+        dump_json(data, self.path)
+
+        self.assertEqual(load_json(self.path), data)
+
+    def test_output_is_readable_by_stdlib(self):
+        """Test that files stay valid UTF-8 JSON with non-ASCII kept as-is."""
+        dump_json({"artist": "Sigur Rós"}, self.path)
+
+        text = self.path.read_text(encoding="utf-8")
+        self.assertIn("Sigur Rós", text)
+        self.assertEqual(json.loads(text), {"artist": "Sigur Rós"})
+
+    def test_compact_output(self):
+        """Test that indentation can be disabled."""
+        dump_json({"a": [1, 2]}, self.path, indent=False)
+
+        self.assertNotIn("\n", self.path.read_text(encoding="utf-8"))
+
+    def test_stream_round_trip(self):
+        """Test that streamed documents load back as regular JSON."""
+        items = ({"id": i, "title": f"Track {i}"} for i in range(3))
+
+        count = dump_json_stream(
+            {"export_info": {"total": 3}}, "tracks", items, self.path
+        )
+
+        self.assertEqual(count, 3)
+        self.assertEqual(
+            load_json(self.path),
+            {
+                "export_info": {"total": 3},
+                "tracks": [{"id": i, "title": f"Track {i}"} for i in range(3)],
+            },
+        )
+
+    def test_stream_empty(self):
+        """Test that an empty item list still produces valid JSON."""
+        count = dump_json_stream({}, "albums", iter([]), self.path)
+
+        self.assertEqual(count, 0)
+        self.assertEqual(load_json(self.path), {"albums": []})
+
+
+if __name__ == "__main__":
+    unittest.main()
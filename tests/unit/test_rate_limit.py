@@ -0,0 +1,88 @@
+"""
+Unit tests for utils.rate_limit module.
+"""
+import unittest
+from unittest.mock import patch
+
+from discogs_to_tidal.utils.rate_limit import RateLimiter
+
+
+class FakeClock:
+    """Deterministic replacement for time.monotonic and time.sleep."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test cases for RateLimiter."""
+
+    def setUp(self):
+        """Patch the clock used by the rate limiter."""
+        self.clock = FakeClock()
+        patcher = patch.multiple(
+            "discogs_to_tidal.utils.rate_limit.time",
+            monotonic=self.clock.monotonic,
+            sleep=self.clock.sleep,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_allows_calls_within_limit(self):
+        """Test that calls under the limit do not block."""
+        limiter = RateLimiter(calls=3, period=60.0)
+
+        for _ in range(3):
+            limiter.acquire()
+
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_blocks_until_token_refills(self):
+        """Test that an empty bucket waits for the next token."""
+        limiter = RateLimiter(calls=2, period=10.0)  # One token every 5s
+
+        limiter.acquire()
+        limiter.acquire()
+        limiter.acquire()
+
+        self.assertEqual(self.clock.sleeps, [5.0])
+
+    def test_refills_over_time(self):
+        """Test that idle time refills the bucket up to its capacity."""
+        limiter = RateLimiter(calls=2, period=10.0)
+
+        limiter.acquire()
+        limiter.acquire()
+        self.clock.now = 100.0
+        limiter.acquire()
+        limiter.acquire()
+
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_update_remaining_caps_tokens(self):
+        """Test that a low server-reported budget slows callers down."""
+        limiter = RateLimiter(calls=10, period=10.0)  # One token per second
+
+        limiter.update_remaining(0)
+        limiter.acquire()
+
+        self.assertEqual(self.clock.sleeps, [1.0])
+
+    def test_invalid_arguments(self):
+        """Test that non-positive limits are rejected."""
+        with self.assertRaises(ValueError):
+            RateLimiter(calls=0, period=1.0)
+        with self.assertRaises(ValueError):
+            RateLimiter(calls=1, period=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
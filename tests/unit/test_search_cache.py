@@ -0,0 +1,103 @@
+"""
+Unit tests for the persistent Tidal search cache.
+"""
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from discogs_to_tidal.integrations.tidal.search import TidalSearchService
+from discogs_to_tidal.integrations.tidal.search_cache import SearchCache
+
+
+class TestSearchCache(unittest.TestCase):
+    """Test cases for SearchCache."""
+
+    def setUp(self):
+        """Set up a cache in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.temp_dir.name) / "cache" / "search.sqlite3"
+        self.cache = SearchCache(self.db_path, negative_ttl_hours=1)
+
+    def tearDown(self):
+        """Close the cache and remove temporary files."""
+        self.cache.close()
+        self.temp_dir.cleanup()
+
+    def test_miss_returns_none(self):
+        """Test that unknown keys are not cached."""
+        self.assertIsNone(self.cache.get("missing"))
+
+    def test_put_and_get_track_id(self):
+        """Test that found track IDs round-trip through the cache."""
+        self.cache.put("key", 12345)
+
+        self.assertEqual(self.cache.get("key"), 12345)
+        self.assertTrue(self.db_path.exists())
+
+    def test_results_persist_across_instances(self):
+        """Test that results survive reopening the database."""
+        self.cache.put("key", 42)
+        self.cache.close()
+
+        reopened = SearchCache(self.db_path)
+        try:
+            self.assertEqual(reopened.get("key"), 42)
+        finally:
+            reopened.close()
+
+    def test_negative_result_expires(self):
+        """Test that cached misses are only honoured within the TTL."""
+        self.cache.put("key", None)
+        self.assertEqual(self.cache.get("key"), SearchCache.NOT_FOUND)
+
+        with patch(
+            "discogs_to_tidal.integrations.tidal.search_cache.time.time",
+            return_value=time.time() + 2 * 3600,
+        ):
+            self.assertIsNone(self.cache.get("key"))
+
+    def test_make_key_normalizes_input(self):
+        """Test that keys ignore case, accents and punctuation."""
+        self.assertEqual(
+            SearchCache.make_key("Café del Mar!", "Energy 52"),
+            SearchCache.make_key("cafe del mar", "ENERGY 52"),
+        )
+        self.assertNotEqual(
+            SearchCache.make_key("Title", "Artist A"),
+            SearchCache.make_key("Title", "Artist B"),
+        )
+
+
+class TestSearchServiceCaching(unittest.TestCase):
+    """Test how TidalSearchService records results in the search cache."""
+
+    def setUp(self):
+        """Set up a search service backed by a mock cache."""
+        self.cache = Mock(spec=SearchCache)
+        self.cache.make_key.return_value = "key"
+        self.cache.get.return_value = None
+        self.service = TidalSearchService(Mock(), search_cache=self.cache)
+
+    def test_failed_search_is_not_cached(self):
+        """Test that a search error isn't stored as a negative result."""
+        with patch.object(
+            self.service, "_search", side_effect=RuntimeError("HTTP 429")
+        ):
+            result = self.service._lookup_track("Title", "Artist")
+
+        self.assertIsNone(result)
+        self.cache.put.assert_not_called()
+
+    def test_clean_miss_is_cached(self):
+        """Test that a search with no matches is stored as a negative result."""
+        with patch.object(self.service, "_search", return_value={"tracks": []}):
+            result = self.service._lookup_track("Title", "Artist")
+
+        self.assertIsNone(result)
+        self.cache.put.assert_called_once_with("key", None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Unit tests for utils.string_utils module.
+"""
+import unittest
+
+from discogs_to_tidal.utils.string_utils import (
+    normalize_string,
+    similarity_ratio,
+    similarity_ratios,
+)
+
+
+class TestNormalizeString(unittest.TestCase):
+    """Test cases for normalize_string."""
+
+    def test_empty_string(self):
+        """Test that empty input normalizes to an empty string."""
+        self.assertEqual(normalize_string(""), "")
+
+    def test_lowercases_and_strips_accents(self):
+        """Test case folding and accent removal."""
+        self.assertEqual(normalize_string("Café Del Mar"), "cafe del mar")
+
+    def test_replaces_punctuation_and_collapses_whitespace(self):
+        """Test punctuation removal and whitespace collapsing."""
+        self.assertEqual(normalize_string("  One--More   Time! "), "one more time")
+
+
+class TestSimilarityRatio(unittest.TestCase):
+    """Test cases for similarity_ratio."""
+
+    def test_identical_strings(self):
+        """Test that identical strings score 1.0."""
+        self.assertEqual(similarity_ratio("daft punk", "daft punk"), 1.0)
+
+    def test_disjoint_strings(self):
+        """Test that strings with no characters in common score 0.0."""
+        self.assertEqual(similarity_ratio("abc", "xyz"), 0.0)
+
+    def test_partial_match(self):
+        """Test that similar strings score between 0 and 1."""
+        ratio = similarity_ratio("one more time", "one more time remix")
+        self.assertGreater(ratio, 0.6)
+        self.assertLess(ratio, 1.0)
+
+    def test_score_cutoff_rejects_by_length(self):
+        """Test that pairs whose lengths cannot reach the cutoff score 0.0."""
+        self.assertEqual(similarity_ratio("abc", "abcdefghij", score_cutoff=0.5), 0.0)
+
+    def test_score_cutoff_keeps_good_matches(self):
+        """Test that a cutoff does not change scores above it."""
+        ratio = similarity_ratio("one more time", "one more time remix")
+        self.assertEqual(
+            similarity_ratio("one more time", "one more time remix", score_cutoff=0.6),
+            ratio,
+        )
+
+
+class TestSimilarityRatios(unittest.TestCase):
+    """Test cases for similarity_ratios."""
+
+    def test_matches_pairwise_scores(self):
+        """Test that batch scores equal individual scores, in order."""
+        choices = ["daft punk", "daft punk & friends", "aphex twin"]
+
+        self.assertEqual(
+            similarity_ratios("daft punk", choices),
+            [similarity_ratio("daft punk", choice) for choice in choices],
+        )
+
+    def test_score_cutoff_zeroes_low_scores(self):
+        """Test that choices below the cutoff score 0.0."""
+        ratios = similarity_ratios("daft punk", ["daft punk", "xyz"], score_cutoff=0.5)
+
+        self.assertEqual(ratios, [1.0, 0.0])
+
+    def test_empty_choices(self):
+        """Test that no choices yield no scores."""
+        self.assertEqual(similarity_ratios("daft punk", []), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -321,3 +321,76 @@ def test_create_style_based_playlists_duplicate_tracks_in_multiple_playlists():
         assert tidal_count == 1  # Found on Tidal
         assert track_titles == ["Multi Style Track"]
         assert playlist_name in ["Base - House", "Base - Techno", "Base - Ambient"]
+
+
+def test_add_tracks_to_playlist_adds_in_batches(tidal_service):
+    """Test that matched tracks are added in chunks instead of one by one."""
+    playlist = Mock()
+    playlist.tracks.return_value = []
+    tidal_service.create_or_get_playlist = Mock(return_value=playlist)
+    tidal_service.playlist_add_batch_size = 2
+
+    artist = Artist(name="Test Artist", id="1")
+    tracks = [Track(title=f"Track {i}", artists=[artist]) for i in range(1, 5)]
+    tidal_tracks = {
+        "Track 1": Mock(id=101),
+        "Track 2": None,  # Not found on Tidal
+        "Track 3": Mock(id=103),
+        "Track 4": Mock(id=104),
+    }
+    tidal_service.search_service.find_track = Mock(
+        side_effect=lambda track: tidal_tracks[track.title]
+    )
+
+    result = tidal_service.add_tracks_to_playlist("Test Playlist", tracks)
+
+    assert [c.args[0] for c in playlist.add.call_args_list] == [[101, 103], [104]]
+    assert result.total_tracks == 4
+    assert result.matched_tracks == 3
+    assert result.failed_tracks == 1
+    assert result.success
+
+
+def test_add_tracks_to_playlist_searches_duplicates_once(tidal_service):
+    """Test that duplicate title/artist pairs are searched and added once."""
+    playlist = Mock()
+    playlist.tracks.return_value = []
+    tidal_service.create_or_get_playlist = Mock(return_value=playlist)
+    tidal_service.search_service.find_track = Mock(return_value=Mock(id=101))
+
+    tracks = [
+        Track(title="Same Track", artists=[Artist(name="Test Artist")]),
+        Track(title="same track!", artists=[Artist(name="TEST ARTIST")]),
+    ]
+
+    result = tidal_service.add_tracks_to_playlist("Test Playlist", tracks)
+
+    tidal_service.search_service.find_track.assert_called_once_with(tracks[0])
+    playlist.add.assert_called_once_with([101])
+    assert result.matched_tracks == 2
+    assert result.failed_tracks == 0
+
+
+def test_add_tracks_to_playlist_skips_tracks_already_in_playlist(tidal_service):
+    """Test that re-syncing does not search or re-add existing tracks."""
+    existing = Mock(id=101, artist=Mock())
+    existing.name = "Existing Track"
+    existing.artist.name = "Test Artist"
+
+    playlist = Mock()
+    playlist.tracks.return_value = [existing]
+    tidal_service.create_or_get_playlist = Mock(return_value=playlist)
+    tidal_service.search_service.find_track = Mock(return_value=Mock(id=102))
+
+    artist = Artist(name="Test Artist", id="1")
+    existing_track = Track(title="Existing Track", artists=[artist])
+    new_track = Track(title="New Track", artists=[artist])
+
+    result = tidal_service.add_tracks_to_playlist(
+        "Test Playlist", [existing_track, new_track]
+    )
+
+    tidal_service.search_service.find_track.assert_called_once_with(new_track)
+    playlist.add.assert_called_once_with([102])
+    assert result.matched_tracks == 2
+    assert result.success
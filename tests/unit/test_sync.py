@@ -417,6 +417,31 @@ class TestSyncService(unittest.TestCase):
         mock_process_albums.assert_called_once()
         mock_handle_playlist.assert_called_once()
 
+    @patch("discogs_to_tidal.core.sync.SyncService._initialize_tidal_session")
+    @patch("discogs_to_tidal.core.sync.SyncService._fetch_discogs_albums")
+    @patch("discogs_to_tidal.core.sync.SyncService._process_albums")
+    def test_sync_collection_uses_preloaded_albums(
+        self, mock_process_albums, mock_fetch_albums, mock_init_session
+    ):
+        """Test sync_collection skips the Discogs fetch for preloaded albums."""
+        sync_service = self._create_sync_service()
+        albums = [(self.test_album, [self.test_track])]
+
+        mock_init_session.return_value = self.mock_session
+        mock_process_albums.return_value = {
+            "total_tracks": 1,
+            "found_tracks": 0,
+            "all_found_tracks": [],
+        }
+
+        result = sync_service.sync_collection(
+            playlist_name="Preloaded", preloaded_albums=albums
+        )
+
+        self.assertTrue(result.success)
+        mock_fetch_albums.assert_not_called()
+        mock_process_albums.assert_called_once_with(albums, None)
+
     @patch("discogs_to_tidal.core.sync.SyncService._initialize_tidal_session")
     @patch("discogs_to_tidal.core.sync.SyncService._fetch_discogs_albums")
     def test_sync_collection_no_albums(self, mock_fetch_albums, mock_init_session):